@@ -1,20 +1,43 @@
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import (
+    Column,
+    DateTime,
+    String,
+    Table,
+    create_engine,
+    func,
+    inspect,
+    select,
+    text,
+)
+from sqlalchemy.schema import CreateIndex
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import configure_mappers, sessionmaker
 from contextlib import contextmanager
 
 # Database configuration
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./data/task_tiles.db")
 
+# Connection pool sizing. Sync endpoints run in FastAPI's threadpool (40
+# threads by default), so the stock 5 + 10 pool would make requests queue
+# for a connection and time out under load.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+
 # Create engine
 engine = create_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
+    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_recycle=3600,
+    pool_pre_ping=True,
 )
 
 # Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 # Base class for models
 Base = declarative_base()
@@ -39,11 +62,105 @@ def get_db_context():
         db.close()
 
 
+# One-off data migrations already applied to this database, by name
+schema_migrations = Table(
+    "schema_migrations",
+    Base.metadata,
+    Column("name", String(100), primary_key=True),
+    Column("applied_at", DateTime, server_default=func.now()),
+)
+
+
+def dedupe_card_contributors(connection):
+    """Keep one row per (card_id, user_id) so the unique index can be built
+
+    Contributors used to be added with a SELECT then INSERT, which could
+    race and record the same user twice.
+    """
+    connection.execute(
+        text(
+            "DELETE FROM card_contributors WHERE id NOT IN ("
+            "SELECT MIN(id) FROM card_contributors GROUP BY card_id, user_id)"
+        )
+    )
+
+
+# (table, column, enum type) for the former Enum columns
+LEGACY_ENUM_COLUMNS = (
+    ("cards", "priority", "priority"),
+    ("board_members", "role", "boardrole"),
+    ("invitations", "status", "invitationstatus"),
+)
+
+
+def lowercase_enum_columns(connection):
+    """Turn the former Enum columns into strings holding the enum values
+
+    priority, role and status were Enum columns, which stored the member
+    names ("MEDIUM"); the models now store the lowercase values in strings.
+    PostgreSQL and MySQL have native enum types to convert first; elsewhere
+    the names were already stored as plain text.
+    """
+    dialect = connection.dialect.name
+    for table, column, enum_type in LEGACY_ENUM_COLUMNS:
+        if dialect == "postgresql":
+            connection.execute(
+                text(
+                    f"ALTER TABLE {table} ALTER COLUMN {column} TYPE VARCHAR(16) "
+                    f"USING lower({column}::text)"
+                )
+            )
+            connection.execute(text(f"DROP TYPE IF EXISTS {enum_type}"))
+            continue
+        if dialect in ("mysql", "mariadb"):
+            connection.execute(text(f"ALTER TABLE {table} MODIFY {column} VARCHAR(16)"))
+        connection.execute(text(f"UPDATE {table} SET {column} = lower({column})"))
+
+
+def add_board_version(connection):
+    """Add boards.version to databases created before the column existed"""
+    columns = {column["name"] for column in inspect(connection).get_columns("boards")}
+    if "version" not in columns:
+        connection.execute(
+            text("ALTER TABLE boards ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+        )
+
+
+# Applied in order, once per database, before the model indexes are created
+MIGRATIONS = (
+    ("dedupe_card_contributors", dedupe_card_contributors),
+    ("lowercase_enum_columns", lowercase_enum_columns),
+    ("add_board_version", add_board_version),
+)
+
+
+def run_migrations(connection):
+    """Apply the MIGRATIONS this database hasn't recorded yet"""
+    applied = set(connection.execute(select(schema_migrations.c.name)).scalars())
+    for name, migrate in MIGRATIONS:
+        if name not in applied:
+            migrate(connection)
+            connection.execute(schema_migrations.insert().values(name=name))
+
+
 def create_tables():
     """Create all database tables"""
-    from models import Base
+    import models  # noqa: F401 - registers the model tables on Base.metadata
+
+    # Resolve relationships once at startup rather than on the first query
+    configure_mappers()
     Base.metadata.create_all(bind=engine)
 
+    # create_all skips tables that already exist, so indexes added to the
+    # models later have to be created explicitly on existing databases.
+    # IF NOT EXISTS rather than checkfirst, which can't reflect expression
+    # indexes such as lower(title) on SQLite.
+    with engine.begin() as connection:
+        run_migrations(connection)
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                connection.execute(CreateIndex(index, if_not_exists=True))
+
 
 def init_database():
     """Initialize database with tables"""
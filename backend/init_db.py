@@ -157,19 +157,25 @@ def init_database_with_sample_data():
 
         # Make demo user a member of Alice's board
         alice_board_member1 = BoardMember(
-            board_id=alice_board.id, user_id=demo_user.id, role=BoardRole.MEMBER
+            board_id=alice_board.id,
+            user_id=demo_user.id,
+            role=BoardRole.MEMBER.value,
         )
         db.add(alice_board_member1)
 
         # Make Charlie a member of Alice's board
         alice_board_member2 = BoardMember(
-            board_id=alice_board.id, user_id=charlie_user.id, role=BoardRole.MEMBER
+            board_id=alice_board.id,
+            user_id=charlie_user.id,
+            role=BoardRole.MEMBER.value,
         )
         db.add(alice_board_member2)
 
         # Make Alice a member of Bob's board
         bob_board_member1 = BoardMember(
-            board_id=bob_board.id, user_id=alice_user.id, role=BoardRole.MEMBER
+            board_id=bob_board.id,
+            user_id=alice_user.id,
+            role=BoardRole.MEMBER.value,
         )
         db.add(bob_board_member1)
 
@@ -183,7 +189,7 @@ def init_database_with_sample_data():
             inviter_id=admin_user.id,
             invitee_id=bob_user.id,
             message="Join our project board to help with administrative tasks!",
-            status=InvitationStatus.PENDING,
+            status=InvitationStatus.PENDING.value,
         )
         db.add(pending_invitation)
 
@@ -193,7 +199,7 @@ def init_database_with_sample_data():
             inviter_id=charlie_user.id,
             invitee_id=admin_user.id,
             message="Would you like to join our collaborative team board?",
-            status=InvitationStatus.PENDING,
+            status=InvitationStatus.PENDING.value,
         )
         db.add(pending_invitation2)
 
@@ -1,16 +1,39 @@
-from fastapi import FastAPI, HTTPException, Depends, status, UploadFile, File
+from fastapi import (
+    FastAPI,
+    HTTPException,
+    Depends,
+    status,
+    UploadFile,
+    File,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.security import HTTPBearer
-from pydantic import BaseModel
-from typing import List, Optional, Union
-from sqlalchemy.orm import Session
-from datetime import timedelta, datetime
+from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import List, NamedTuple, Optional, Union
+from sqlalchemy import and_, case, func, or_, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, contains_eager, joinedload, selectinload
+from datetime import timedelta, datetime, time as dt_time
+import asyncio
+import hashlib
 import json
 import os
 import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
 
+import httpx
 import openai
 from dotenv import load_dotenv
+from rapidfuzz import fuzz, process
 
 # Import database components
 from database import get_db, init_database
@@ -24,6 +47,7 @@ from models import (
     CardContributor as CardContributorModel,
     InvitationStatus,
     BoardRole,
+    Priority,
 )
 from auth import (
     authenticate_user,
@@ -47,6 +71,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON payloads (board trees repeat the same user fields a lot)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 
 # Pydantic models for API requests/responses
 class UserCreate(BaseModel):
@@ -119,12 +146,22 @@ class ListCreate(BaseModel):
     board_id: int
 
 
+# Priorities as stored in the cards table and sent over the API
+PRIORITY_VALUES = frozenset(priority.value for priority in Priority)
+
+
 class CardCreate(BaseModel):
     title: str
     description: Optional[str] = None
     list_id: int
     priority: Optional[str] = "medium"
 
+    @field_validator("priority")
+    @classmethod
+    def validate_priority(cls, priority: Optional[str]) -> str:
+        # Unknown or missing priorities fall back to medium
+        return priority if priority in PRIORITY_VALUES else "medium"
+
 
 class CardUpdate(BaseModel):
     title: Optional[str] = None
@@ -132,17 +169,44 @@ class CardUpdate(BaseModel):
     checklist: Optional[List[str]] = None
     priority: Optional[str] = None
 
+    @field_validator("priority")
+    @classmethod
+    def validate_priority(cls, priority: Optional[str]) -> Optional[str]:
+        # None leaves the priority unchanged; unknown values fall back to medium
+        if priority is None or priority in PRIORITY_VALUES:
+            return priority
+        return "medium"
+
 
 class Contributor(BaseModel):
     id: int
     username: str
     full_name: Optional[str] = None
     avatar_url: Optional[str] = None
-    contributed_at: str
+    contributed_at: datetime
 
     class Config:
         from_attributes = True
 
+    @model_validator(mode="before")
+    @classmethod
+    def flatten_contributor(cls, data):
+        # Contributor rows carry the user fields on their related user
+        if isinstance(data, CardContributorModel):
+            return {
+                "id": data.user.id,
+                "username": data.user.username,
+                "full_name": data.user.full_name,
+                "avatar_url": data.user.avatar_url,
+                "contributed_at": data.contributed_at,
+            }
+        return data
+
+
+# Most recent contributors embedded in each card response; the full list is
+# paged through GET /api/cards/{card_id}/contributors
+CARD_CONTRIBUTORS_PREVIEW = 10
+
 
 class Card(BaseModel):
     id: int
@@ -152,14 +216,33 @@ class Card(BaseModel):
     position: int = 0
     checklist: List[str] = []
     priority: str = "medium"
-    created_at: str
-    updated_at: str
+    created_at: datetime
+    updated_at: datetime
     creator: User
-    contributors: List[Contributor] = []
+    # Set on the ORM card by attach_contributor_previews
+    contributors: List[Contributor] = Field([], validation_alias="contributor_preview")
+    contributors_count: int = 0
 
     class Config:
         from_attributes = True
 
+    @field_validator("checklist", mode="before")
+    @classmethod
+    def default_checklist(cls, checklist):
+        return checklist or []
+
+    @field_validator("priority", mode="before")
+    @classmethod
+    def default_priority(cls, priority):
+        return priority or "medium"
+
+
+class ContributorPage(BaseModel):
+    contributors: List[Contributor]
+    total: int
+    next_after: Optional[datetime] = None
+    next_after_id: Optional[int] = None
+
 
 class TaskList(BaseModel):
     id: int
@@ -243,8 +326,16 @@ load_dotenv()
 # Initialize OpenAI client
 api_key = os.getenv("OPENAI_API_KEY")
 if api_key:
-    openai_client = openai.OpenAI(api_key=api_key)
+    # Share one pooled HTTP/2 client across requests so concurrent chatbot
+    # calls reuse the same TLS connection instead of handshaking each time
+    openai_http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        timeout=30,
+    )
+    openai_client = openai.AsyncOpenAI(api_key=api_key, http_client=openai_http_client)
 else:
+    openai_http_client = None
     openai_client = None
     print("⚠️  Warning: OPENAI_API_KEY not set. AI features will be disabled.")
     print("   Create a .env file with your OpenAI API key to enable AI features.")
@@ -404,37 +495,185 @@ CHATBOT_FUNCTIONS = [
 ]
 
 
+# Static part of the chatbot system prompt. It is identical for every request
+# so it is sent first, letting OpenAI reuse its cached prompt prefix.
+CHATBOT_SYSTEM_PROMPT = """You are a helpful AI assistant for Task Tiles, a Kanban-style task management system.
+
+IMPORTANT TERMINOLOGY:
+- **BOARD**: A workspace/project container (like "Marketing Campaign" or "Personal Projects")
+- **LIST**: A column within a board representing workflow stages (like "To Do", "In Progress", "Done")
+- **CARD/TASK**: Individual work items within lists (like "Write blog post" or "Fix login bug")
+
+HIERARCHY: Board → Lists → Cards/Tasks
+Example: "Marketing Campaign" board has lists "Ideas", "In Progress", "Review", "Published"
+
+The next system message tells you which user you're helping and contains the CURRENT BOARD CONTEXT.
+
+YOUR PERSONALITY:
+- Be conversational and friendly
+- Use emojis to make responses engaging
+- Always ask for clarification when information is missing
+- Explain what you're doing and why
+- Provide helpful suggestions
+- Remember our conversation context and refer back to previous messages when relevant
+- Use the current board context to resolve ambiguous references
+
+CONVERSATION MEMORY:
+- You can reference previous messages in our conversation
+- Build on previous context when users make follow-up requests
+- If a user says "add another one" or "do the same for X", use previous context
+- Remember user preferences and workflow patterns from the conversation
+
+SMART CONTEXT RESOLUTION:
+- When user mentions a list name, first try to find it in the CURRENT board
+- Handle typos by finding the closest match (e.g., "todoo" → "To Do", "bugs" → "Bug Fixes")
+- For ambiguous references, use current board context and conversation history
+- If user doesn't specify a board, assume they mean the current board
+- Only ask for clarification if you can't reasonably determine what they mean
+
+ENHANCED CONTEXT AWARENESS:
+- Use the detailed board layout information provided to answer questions directly
+- When user asks "What's in my To Do list?" - list the specific cards from the board context
+- When user asks "Summarize my tasks" or "Summarize the board" - provide a comprehensive summary using the detailed board info
+- When user asks "What are my high priority tasks?" - identify and list high priority cards
+- When user asks "How many tasks do I have?" - count cards from the detailed board layout
+- When user asks "What's in Study Guide?" - look at the board context and list all cards in that list
+- Reference specific card IDs when suggesting actions (e.g., "You could move card #123 to Done")
+- Always check the DETAILED BOARD LAYOUT section of the board context for complete card and list information
+- NEVER say you can't summarize or don't have access to board content when detailed context is provided
+
+SUMMARIZATION GUIDELINES:
+- Use the detailed board context provided in the system messages to answer summary questions
+- When asked to summarize a specific list, extract that list's cards from the board context
+- When asked to summarize the board, provide an overview of all lists and their contents
+- Include card titles, priorities, and descriptions in summaries
+- Count tasks accurately using the provided context data
+
+WHEN TO USE FUNCTION CALLS vs DIRECT RESPONSES:
+- Use DIRECT RESPONSES for: queries about board content, summaries, counts, priority identification
+- Use FUNCTION CALLS for: creating, moving, deleting, or modifying board items
+- If you have the information in the board context, answer directly without function calls
+- Only use function calls when you need to perform an action or get information not in the current context
+
+WHEN TO ASK FOR CLARIFICATION:
+- User says "create a task" but current board has no lists
+- User mentions a list that doesn't exist in current board and you can't find a close match
+- User asks about "tasks" but doesn't specify timeframe or location
+- Truly ambiguous requests that can't be resolved with current context
+
+RESPONSE STYLE:
+- Start with a friendly acknowledgment
+- If you need more info, ask specific questions with examples from the current board
+- If you can help, explain what you're doing and which board/list you're using
+- Use board/list/card terminology consistently
+- Reference current board context naturally
+- Handle typos gracefully without making a big deal about them
+- When providing summaries or lists, use the detailed board information
+- Include specific card names, priorities, and descriptions when relevant
+
+EXAMPLES OF ENHANCED CONTEXT-AWARE RESPONSES:
+❌ "I need to call a function to see your tasks"
+✅ "Looking at your current board, I can see you have 5 tasks in your To Do list: 1. 🔴 'Fix login bug' (high priority), 2. 🟡 'Update homepage'..."
+
+❌ "Let me get your board information"
+✅ "Based on your current board layout, you have 3 high priority tasks: 'Fix login bug' in To Do, 'Review PR' in In Progress, and 'Deploy hotfix' in Done."
+
+Always be helpful and use the current board context to make interactions as smooth as possible."""
+
+
 # Helper functions
-def has_board_access(user_id: int, board_id: int, db: Session) -> bool:
-    """Check if user has access to board (owner or member)"""
-    board = db.query(BoardModel).filter(BoardModel.id == board_id).first()
-    if not board:
-        return False
+class TTLCache:
+    """Small in-process LRU cache whose entries expire after ``ttl`` seconds"""
 
-    if board.owner_id == user_id:
-        return True
+    def __init__(self, ttl: float, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
 
-    membership = (
-        db.query(BoardMemberModel)
-        .filter(
-            BoardMemberModel.board_id == board_id, BoardMemberModel.user_id == user_id
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key, value):
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+# Direct (non function-calling) chatbot answers keyed by the exact prompt sent
+chatbot_response_cache = TTLCache(ttl=600)
+
+
+def has_board_access(user_id: int, board_id: int, db: Session) -> bool:
+    """Check if user has access to board (owner or member)
+
+    Results are memoized on the session, which lives for a single request,
+    so repeated checks for the same board don't hit the database again.
+    """
+    access_cache = db.info.setdefault("board_access", {})
+    key = (user_id, board_id)
+    if key not in access_cache:
+        is_member = (
+            db.query(BoardMemberModel.id)
+            .filter(
+                BoardMemberModel.board_id == BoardModel.id,
+                BoardMemberModel.user_id == user_id,
+            )
+            .exists()
         )
-        .first()
+        access_cache[key] = (
+            db.query(BoardModel.id)
+            .filter(
+                BoardModel.id == board_id,
+                or_(BoardModel.owner_id == user_id, is_member),
+            )
+            .first()
+            is not None
+        )
+
+    return access_cache[key]
+
+
+def board_access_clause(user_id: int):
+    """SQL condition matching boards the user owns or is a member of"""
+    member_board_ids = (
+        select(BoardMemberModel.board_id)
+        .where(BoardMemberModel.user_id == user_id)
+        .scalar_subquery()
     )
+    return or_(BoardModel.owner_id == user_id, BoardModel.id.in_(member_board_ids))
 
-    return membership is not None
 
+def get_user_boards(user_id: int, db: Session, *options):
+    """Get all boards user has access to (owned + member of)
 
-def get_user_boards(user_id: int, db: Session):
-    """Get all boards user has access to (owned + member of)"""
+    Extra loader options (e.g. ``board_tree_options()``) are applied to both
+    queries so callers can eager-load whatever part of the tree they need.
+    """
     # Get owned boards
-    owned_boards = db.query(BoardModel).filter(BoardModel.owner_id == user_id).all()
+    owned_boards = (
+        db.query(BoardModel)
+        .options(*options)
+        .filter(BoardModel.owner_id == user_id)
+        .all()
+    )
 
     # Get boards user is member of
-    memberships = (
-        db.query(BoardMemberModel).filter(BoardMemberModel.user_id == user_id).all()
+    member_boards = (
+        db.query(BoardModel)
+        .options(*options)
+        .join(BoardMemberModel, BoardMemberModel.board_id == BoardModel.id)
+        .filter(BoardMemberModel.user_id == user_id)
+        .all()
     )
-    member_boards = [membership.board for membership in memberships]
 
     # Combine and remove duplicates
     all_boards = owned_boards + member_boards
@@ -448,32 +687,348 @@ def get_user_boards(user_id: int, db: Session):
     return unique_boards
 
 
-def build_board_data(board: BoardModel, db: Session):
-    """Build complete board data with lists, cards, and contributors"""
-    # Get all members
-    members = []
-    member_records = (
-        db.query(BoardMemberModel).filter(BoardMemberModel.board_id == board.id).all()
+def bump_board_versions(db: Session, *board_ids: int):
+    """Mark boards as changed for the GET /api/boards ETag
+
+    Call from every write that changes a board's lists, cards, members or
+    contributors. updated_at is kept as is: it tracks edits to the board
+    itself, and a bulk UPDATE would otherwise apply its onupdate.
+    """
+    db.query(BoardModel).filter(BoardModel.id.in_(board_ids)).update(
+        {
+            BoardModel.version: BoardModel.version + 1,
+            BoardModel.updated_at: BoardModel.updated_at,
+        },
+        synchronize_session=False,
     )
-    for member_record in member_records:
-        members.append(
-            {
-                "id": member_record.user.id,
-                "username": member_record.user.username,
-                "email": member_record.user.email,
-                "full_name": member_record.user.full_name,
-                "avatar_url": member_record.user.avatar_url,
-                "is_active": member_record.user.is_active,
-            }
-        )
 
-    # Get lists for this board
-    lists = (
-        db.query(TaskListModel)
-        .filter(TaskListModel.board_id == board.id)
-        .order_by(TaskListModel.position)
+
+def bump_user_board_versions(db: Session, user_id: int):
+    """Bump every board the user can see, e.g. after a profile change"""
+    db.query(BoardModel).filter(board_access_clause(user_id)).update(
+        {
+            BoardModel.version: BoardModel.version + 1,
+            BoardModel.updated_at: BoardModel.updated_at,
+        },
+        synchronize_session=False,
+    )
+
+
+def get_boards_etag(user_id: int, db: Session) -> str:
+    """ETag for GET /api/boards from one query over the user's boards
+
+    Each board's version is bumped by every change to its contents (see
+    ``bump_board_versions``) and updated_at by edits to the board itself;
+    ids cover boards being created, deleted or shared with the user.
+    """
+    rows = (
+        db.query(BoardModel.id, BoardModel.version, BoardModel.updated_at)
+        .filter(board_access_clause(user_id))
+        .order_by(BoardModel.id)
         .all()
     )
+    fingerprint = f"{user_id}:{[tuple(row) for row in rows]}"
+    digest = hashlib.blake2b(fingerprint.encode(), digest_size=8).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check an ETag against the request's If-None-Match header"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(
+        tag.removeprefix("W/") == etag for tag in candidates
+    )
+
+
+def card_detail_options():
+    """Loader options that fetch a card's creator with it
+
+    Contributors are not loaded here; see ``attach_contributor_previews``.
+    """
+    return (joinedload(CardModel.creator),)
+
+
+def attach_contributor_previews(cards, db: Session):
+    """Set ``contributor_preview`` and ``contributors_count`` on each card
+
+    One query fetches each card's most recent contributors (newest first,
+    the order of the contributors endpoint) together with its total count,
+    so cards with many contributors don't load them all.
+    """
+    previews = {card.id: [] for card in cards}
+    counts = {}
+    if previews:
+        ranked = (
+            select(
+                CardContributorModel.id,
+                func.row_number()
+                .over(
+                    partition_by=CardContributorModel.card_id,
+                    order_by=(
+                        CardContributorModel.contributed_at.desc(),
+                        CardContributorModel.id.desc(),
+                    ),
+                )
+                .label("rank"),
+                func.count()
+                .over(partition_by=CardContributorModel.card_id)
+                .label("total"),
+            )
+            .where(CardContributorModel.card_id.in_(list(previews)))
+            .subquery()
+        )
+        rows = (
+            db.query(CardContributorModel, ranked.c.total)
+            .join(ranked, ranked.c.id == CardContributorModel.id)
+            .options(joinedload(CardContributorModel.user))
+            .filter(ranked.c.rank <= CARD_CONTRIBUTORS_PREVIEW)
+            .order_by(ranked.c.rank)
+            .all()
+        )
+        for contributor, total in rows:
+            previews[contributor.card_id].append(contributor)
+            counts[contributor.card_id] = total
+
+    for card in cards:
+        card.contributor_preview = previews[card.id]
+        card.contributors_count = counts.get(card.id, 0)
+
+
+def get_card_with_details(card_id: int, db: Session, *options):
+    """Load a card together with everything the Card response model needs
+
+    Objects aren't expired on commit, so this repopulates a card already in
+    the session to pick up changes made with bulk statements and server-set
+    timestamps.
+    """
+    card = (
+        db.query(CardModel)
+        .options(*card_detail_options(), *options)
+        .populate_existing()
+        .filter(CardModel.id == card_id)
+        .first()
+    )
+    if card:
+        attach_contributor_previews([card], db)
+    return card
+
+
+def resolve_card_with_access(card_id: int, user_id: int, db: Session, *options):
+    """Load a card with its list and check the user can access its board
+
+    The card, its list and the access check come back in a single query.
+    Raises 404 if the card doesn't exist or its board isn't accessible.
+    """
+    row = (
+        db.query(CardModel, board_access_clause(user_id))
+        .join(CardModel.task_list)
+        .join(TaskListModel.board)
+        .options(contains_eager(CardModel.task_list), *options)
+        .filter(CardModel.id == card_id)
+        .first()
+    )
+    if not row:
+        raise HTTPException(status_code=404, detail="Card not found")
+
+    card, has_access = row
+    # Seed the per-request access memo used by has_board_access
+    access_cache = db.info.setdefault("board_access", {})
+    access_cache[(user_id, card.task_list.board_id)] = bool(has_access)
+    if not has_access:
+        raise HTTPException(status_code=404, detail="Board not found")
+
+    return card
+
+
+# Dialects whose INSERT supports ON CONFLICT DO NOTHING
+UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def add_card_contributor(db: Session, card_id: int, user_id: int):
+    """Record a user as a card contributor unless they already are one.
+
+    Uses a single INSERT ... ON CONFLICT DO NOTHING where supported so
+    concurrent requests cannot add the same contributor twice.
+    """
+    insert = UPSERT_INSERTS.get(db.get_bind().dialect.name)
+    if insert is None:
+        exists = (
+            db.query(CardContributorModel.id)
+            .filter(
+                CardContributorModel.card_id == card_id,
+                CardContributorModel.user_id == user_id,
+            )
+            .first()
+        )
+        if not exists:
+            db.add(CardContributorModel(card_id=card_id, user_id=user_id))
+        return
+
+    db.execute(
+        insert(CardContributorModel)
+        .values(card_id=card_id, user_id=user_id)
+        .on_conflict_do_nothing(index_elements=["card_id", "user_id"])
+    )
+
+
+def count_list_cards(list_id: int, db: Session) -> int:
+    """Number of cards in a list, which is also the next free card position"""
+    return (
+        db.query(func.count(CardModel.id)).filter(CardModel.list_id == list_id).scalar()
+    )
+
+
+def count_board_lists(board_id: int, db: Session) -> int:
+    """Number of lists on a board, which is also the next free list position"""
+    return (
+        db.query(func.count(TaskListModel.id))
+        .filter(TaskListModel.board_id == board_id)
+        .scalar()
+    )
+
+
+def reposition_card(
+    db: Session,
+    card_id: int,
+    old_list_id: int,
+    old_position: int,
+    new_list_id: int,
+    new_position: int,
+):
+    """Move a card and renumber the other cards it affects with one UPDATE"""
+    moved = CardModel.id == card_id
+    if old_list_id != new_list_id:
+        # Close the gap in the old list and open one in the new list
+        closing = and_(
+            CardModel.list_id == old_list_id, CardModel.position > old_position
+        )
+        opening = and_(
+            CardModel.list_id == new_list_id, CardModel.position >= new_position
+        )
+        affected = or_(closing, opening)
+        shifted = case((closing, CardModel.position - 1), else_=CardModel.position + 1)
+    elif new_position > old_position:
+        # Moving down in the same list
+        affected = and_(
+            CardModel.list_id == old_list_id,
+            CardModel.position > old_position,
+            CardModel.position <= new_position,
+        )
+        shifted = CardModel.position - 1
+    elif new_position < old_position:
+        # Moving up in the same list
+        affected = and_(
+            CardModel.list_id == old_list_id,
+            CardModel.position >= new_position,
+            CardModel.position < old_position,
+        )
+        shifted = CardModel.position + 1
+    else:
+        return
+
+    db.query(CardModel).filter(or_(moved, affected)).update(
+        {
+            CardModel.list_id: case((moved, new_list_id), else_=CardModel.list_id),
+            CardModel.position: case((moved, new_position), else_=shifted),
+        },
+        synchronize_session=False,
+    )
+
+
+def delete_card_and_close_gap(db: Session, card: CardModel):
+    """Delete a card and its contributors, then close the gap in its list"""
+    db.query(CardContributorModel).filter(
+        CardContributorModel.card_id == card.id
+    ).delete(synchronize_session=False)
+    db.query(CardModel).filter(CardModel.id == card.id).delete(
+        synchronize_session=False
+    )
+    db.query(CardModel).filter(
+        CardModel.list_id == card.list_id, CardModel.position > card.position
+    ).update({CardModel.position: CardModel.position - 1}, synchronize_session=False)
+
+
+def delete_list_with_cards(db: Session, list_id: int) -> int:
+    """Delete a list, its cards and their contributors with bulk DELETEs
+
+    Returns the number of cards deleted, taken from the DELETE itself.
+    """
+    list_card_ids = select(CardModel.id).where(CardModel.list_id == list_id)
+    db.query(CardContributorModel).filter(
+        CardContributorModel.card_id.in_(list_card_ids)
+    ).delete(synchronize_session=False)
+    cards_deleted = (
+        db.query(CardModel)
+        .filter(CardModel.list_id == list_id)
+        .delete(synchronize_session=False)
+    )
+    db.query(TaskListModel).filter(TaskListModel.id == list_id).delete(
+        synchronize_session=False
+    )
+    return cards_deleted
+
+
+def board_tree_options():
+    """Loader options that fetch a board's lists, cards and users up front.
+
+    The whole tree (owner, members, lists, cards, creators, contributors) is
+    loaded in a fixed number of queries instead of one query per row.
+    """
+    return (
+        joinedload(BoardModel.owner),
+        selectinload(BoardModel.members).joinedload(BoardMemberModel.user),
+        selectinload(BoardModel.lists)
+        .selectinload(TaskListModel.cards)
+        .options(*card_detail_options()),
+    )
+
+
+def board_lists_options():
+    """Loader options that fetch a board's lists and their cards up front.
+
+    Used by the chatbot functions, which walk ``board.lists`` and
+    ``list.cards`` without needing card creators or contributors.
+    """
+    return (selectinload(BoardModel.lists).selectinload(TaskListModel.cards),)
+
+
+def get_chatbot_boards(user: UserModel, db: Session):
+    """The user's boards with lists and cards loaded, for the chatbot functions
+
+    Memoized on the session, which lives for a single request, so several
+    chatbot steps in one request share one load. Boards created during the
+    request must call ``forget_chatbot_boards``. Board, list and card titles
+    are lowercased once here for the title lookups (see ``lower_title``).
+    """
+    boards_cache = db.info.setdefault("chatbot_boards", {})
+    if user.id not in boards_cache:
+        boards = get_user_boards(user.id, db, *board_lists_options())
+        for board in boards:
+            board._title_lower = board.title.lower()
+            for lst in board.lists:
+                lst._title_lower = lst.title.lower()
+                for card in lst.cards:
+                    card._title_lower = card.title.lower()
+        boards_cache[user.id] = boards
+    return boards_cache[user.id]
+
+
+def forget_chatbot_boards(user: UserModel, db: Session):
+    """Drop the memoized chatbot boards after the user's boards change"""
+    db.info.get("chatbot_boards", {}).pop(user.id, None)
+
+
+def build_board_data(board: BoardModel, db: Session):
+    """Build complete board data with lists, cards, and contributors
+
+    Users and cards are left as ORM objects for the response models to
+    serialize. Load the board with ``board_tree_options()`` to avoid lazy
+    loads here.
+    """
+    members = [member.user for member in board.members]
 
     board_data = {
         "id": board.id,
@@ -481,77 +1036,21 @@ def build_board_data(board: BoardModel, db: Session):
         "description": board.description,
         "created_at": board.created_at.isoformat(),
         "updated_at": board.updated_at.isoformat(),
-        "owner": {
-            "id": board.owner.id,
-            "username": board.owner.username,
-            "email": board.owner.email,
-            "full_name": board.owner.full_name,
-            "avatar_url": board.owner.avatar_url,
-            "is_active": board.owner.is_active,
-        },
+        "owner": board.owner,
         "members": members,
         "is_shared": len(members) > 0,
         "lists": [],
     }
 
-    for task_list in lists:
-        # Get cards for this list
-        cards = (
-            db.query(CardModel)
-            .filter(CardModel.list_id == task_list.id)
-            .order_by(CardModel.position)
-            .all()
-        )
-
+    for task_list in sorted(board.lists, key=lambda lst: lst.position):
         list_data = {
             "id": task_list.id,
             "title": task_list.title,
             "position": task_list.position,
             "created_at": task_list.created_at.isoformat(),
-            "cards": [],
+            "cards": sorted(task_list.cards, key=lambda card: card.position),
         }
 
-        for card in cards:
-            # Get contributors
-            contributors = []
-            contributor_records = (
-                db.query(CardContributorModel)
-                .filter(CardContributorModel.card_id == card.id)
-                .all()
-            )
-            for contrib in contributor_records:
-                contributors.append(
-                    {
-                        "id": contrib.user.id,
-                        "username": contrib.user.username,
-                        "full_name": contrib.user.full_name,
-                        "avatar_url": contrib.user.avatar_url,
-                        "contributed_at": contrib.contributed_at.isoformat(),
-                    }
-                )
-
-            card_data = {
-                "id": card.id,
-                "title": card.title,
-                "description": card.description,
-                "list_id": card.list_id,
-                "position": card.position,
-                "checklist": card.checklist or [],
-                "priority": card.priority.value if card.priority else "medium",
-                "created_at": card.created_at.isoformat(),
-                "updated_at": card.updated_at.isoformat(),
-                "creator": {
-                    "id": card.creator.id,
-                    "username": card.creator.username,
-                    "email": card.creator.email,
-                    "full_name": card.creator.full_name,
-                    "avatar_url": card.creator.avatar_url,
-                    "is_active": card.creator.is_active,
-                },
-                "contributors": contributors,
-            }
-            list_data["cards"].append(card_data)
-
         board_data["lists"].append(list_data)
 
     return board_data
@@ -564,6 +1063,13 @@ async def startup_event():
     init_database()
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close pooled connections when the application stops"""
+    if openai_http_client:
+        await openai_http_client.aclose()
+
+
 @app.get("/")
 async def root():
     return {"message": "Task Tiles API is running with collaborative features!"}
@@ -574,14 +1080,15 @@ async def root():
 async def register(user_data: UserCreate, db: Session = Depends(get_db)):
     """Register a new user"""
     # Check if user already exists
-    if db.query(UserModel).filter(UserModel.username == user_data.username).first():
+    if db.query(UserModel.id).filter(UserModel.username == user_data.username).first():
         raise HTTPException(status_code=400, detail="Username already registered")
 
-    if db.query(UserModel).filter(UserModel.email == user_data.email).first():
+    if db.query(UserModel.id).filter(UserModel.email == user_data.email).first():
         raise HTTPException(status_code=400, detail="Email already registered")
 
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    # bcrypt is CPU-bound, keep it off the event loop
+    hashed_password = await asyncio.to_thread(get_password_hash, user_data.password)
     db_user = UserModel(
         username=user_data.username,
         email=user_data.email,
@@ -589,7 +1096,6 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
     )
     db.add(db_user)
     db.commit()
-    db.refresh(db_user)
 
     return db_user
 
@@ -597,7 +1103,9 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
 @app.post("/api/login", response_model=Token)
 async def login(user_data: UserLogin, db: Session = Depends(get_db)):
     """Login user and return access token"""
-    user = authenticate_user(db, user_data.username, user_data.password)
+    user = await asyncio.to_thread(
+        authenticate_user, db, user_data.username, user_data.password
+    )
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -620,7 +1128,7 @@ async def read_users_me(current_user: UserModel = Depends(get_current_active_use
 
 
 @app.put("/api/me", response_model=UserProfile)
-async def update_user_profile(
+def update_user_profile(
     user_update: UserUpdate,
     current_user: UserModel = Depends(get_current_active_user),
     db: Session = Depends(get_db),
@@ -645,8 +1153,10 @@ async def update_user_profile(
     if user_update.avatar_url is not None:
         current_user.avatar_url = user_update.avatar_url
 
+    # The user is embedded in their boards as owner, member, creator or
+    # contributor
+    bump_user_board_versions(db, current_user.id)
     db.commit()
-    db.refresh(current_user)
     return current_user
 
 
@@ -659,12 +1169,14 @@ async def update_password(
     """Update user password"""
     from auth import verify_password
 
-    if not verify_password(
-        password_update.current_password, current_user.hashed_password
+    if not await asyncio.to_thread(
+        verify_password, password_update.current_password, current_user.hashed_password
     ):
         raise HTTPException(status_code=400, detail="Current password is incorrect")
 
-    current_user.hashed_password = get_password_hash(password_update.new_password)
+    current_user.hashed_password = await asyncio.to_thread(
+        get_password_hash, password_update.new_password
+    )
     db.commit()
 
     return {"message": "Password updated successfully"}
@@ -672,12 +1184,24 @@ async def update_password(
 
 # Board endpoints
 @app.get("/api/boards", response_model=List[Board])
-async def get_boards(
+def get_boards(
+    request: Request,
+    response: Response,
     current_user: UserModel = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
     """Get all boards user has access to"""
-    boards = get_user_boards(current_user.id, db)
+    # Polling clients usually see unchanged data, so answer conditional
+    # requests before building the full board tree
+    etag = get_boards_etag(current_user.id, db)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+    boards = get_user_boards(current_user.id, db, *board_tree_options())
+    attach_contributor_previews(
+        [card for board in boards for lst in board.lists for card in lst.cards], db
+    )
 
     board_list = []
     for board in boards:
@@ -688,7 +1212,7 @@ async def get_boards(
 
 
 @app.post("/api/boards", response_model=Board)
-async def create_board(
+def create_board(
     board_data: BoardCreate,
     current_user: UserModel = Depends(get_current_active_user),
     db: Session = Depends(get_db),
@@ -702,13 +1226,12 @@ async def create_board(
 
     db.add(board)
     db.commit()
-    db.refresh(board)
 
     return build_board_data(board, db)
 
 
 @app.get("/api/boards/{board_id}", response_model=Board)
-async def get_board(
+def get_board(
     board_id: int,
     current_user: UserModel = Depends(get_current_active_user),
     db: Session = Depends(get_db),
@@ -717,12 +1240,18 @@ async def get_board(
     if not has_board_access(current_user.id, board_id, db):
         raise HTTPException(status_code=404, detail="Board not found")
 
-    board = db.query(BoardModel).filter(BoardModel.id == board_id).first()
+    board = (
+        db.query(BoardModel)
+        .options(*board_tree_options())
+        .filter(BoardModel.id == board_id)
+        .first()
+    )
+    attach_contributor_previews([card for lst in board.lists for card in lst.cards], db)
     return build_board_data(board, db)
 
 
 @app.post("/api/boards/{board_id}/invite")
-async def invite_user_to_board(
+def invite_user_to_board(
     board_id: int,
     invitation: BoardInvite,
     current_user: UserModel = Depends(get_current_active_user),
@@ -740,21 +1269,23 @@ async def invite_user_to_board(
         )
 
     # Find the user to invite
-    invitee = (
-        db.query(UserModel).filter(UserModel.username == invitation.username).first()
+    invitee_id = (
+        db.query(UserModel.id)
+        .filter(UserModel.username == invitation.username)
+        .scalar()
     )
-    if not invitee:
+    if invitee_id is None:
         raise HTTPException(status_code=404, detail="User not found")
 
-    if invitee.id == current_user.id:
+    if invitee_id == current_user.id:
         raise HTTPException(status_code=400, detail="Cannot invite yourself")
 
     # Check if user is already a member or has pending invitation
     existing_member = (
-        db.query(BoardMemberModel)
+        db.query(BoardMemberModel.id)
         .filter(
             BoardMemberModel.board_id == board_id,
-            BoardMemberModel.user_id == invitee.id,
+            BoardMemberModel.user_id == invitee_id,
         )
         .first()
     )
@@ -765,11 +1296,11 @@ async def invite_user_to_board(
         )
 
     existing_invitation = (
-        db.query(InvitationModel)
+        db.query(InvitationModel.id)
         .filter(
             InvitationModel.board_id == board_id,
-            InvitationModel.invitee_id == invitee.id,
-            InvitationModel.status == InvitationStatus.PENDING,
+            InvitationModel.invitee_id == invitee_id,
+            InvitationModel.status == InvitationStatus.PENDING.value,
         )
         .first()
     )
@@ -783,7 +1314,7 @@ async def invite_user_to_board(
     new_invitation = InvitationModel(
         board_id=board_id,
         inviter_id=current_user.id,
-        invitee_id=invitee.id,
+        invitee_id=invitee_id,
         message=invitation.message,
     )
 
@@ -794,7 +1325,7 @@ async def invite_user_to_board(
 
 
 @app.get("/api/invitations", response_model=List[Invitation])
-async def get_user_invitations(
+def get_user_invitations(
     current_user: UserModel = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
@@ -803,7 +1334,7 @@ async def get_user_invitations(
         db.query(InvitationModel)
         .filter(
             InvitationModel.invitee_id == current_user.id,
-            InvitationModel.status == InvitationStatus.PENDING,
+            InvitationModel.status == InvitationStatus.PENDING.value,
         )
         .all()
     )
@@ -823,7 +1354,7 @@ async def get_user_invitations(
                 "is_active": invitation.inviter.is_active,
             },
             "message": invitation.message,
-            "status": invitation.status.value,
+            "status": invitation.status,
             "created_at": invitation.created_at.isoformat(),
         }
         invitation_list.append(invitation_data)
@@ -832,7 +1363,7 @@ async def get_user_invitations(
 
 
 @app.post("/api/invitations/{invitation_id}/respond")
-async def respond_to_invitation(
+def respond_to_invitation(
     invitation_id: int,
     response: InvitationResponse,
     current_user: UserModel = Depends(get_current_active_user),
@@ -844,7 +1375,7 @@ async def respond_to_invitation(
         .filter(
             InvitationModel.id == invitation_id,
             InvitationModel.invitee_id == current_user.id,
-            InvitationModel.status == InvitationStatus.PENDING,
+            InvitationModel.status == InvitationStatus.PENDING.value,
         )
         .first()
     )
@@ -855,15 +1386,18 @@ async def respond_to_invitation(
     if response.accept:
         # Accept invitation - add user as board member
         board_member = BoardMemberModel(
-            board_id=invitation.board_id, user_id=current_user.id, role=BoardRole.MEMBER
+            board_id=invitation.board_id,
+            user_id=current_user.id,
+            role=BoardRole.MEMBER.value,
         )
         db.add(board_member)
-        invitation.status = InvitationStatus.ACCEPTED
+        bump_board_versions(db, invitation.board_id)
+        invitation.status = InvitationStatus.ACCEPTED.value
     else:
         # Decline invitation
-        invitation.status = InvitationStatus.DECLINED
+        invitation.status = InvitationStatus.DECLINED.value
 
-    invitation.responded_at = datetime.utcnow()
+    invitation.responded_at = func.now()
     db.commit()
 
     action = "accepted" if response.accept else "declined"
@@ -871,7 +1405,7 @@ async def respond_to_invitation(
 
 
 @app.post("/api/lists", response_model=TaskList)
-async def create_list(
+def create_list(
     list_data: ListCreate,
     current_user: UserModel = Depends(get_current_active_user),
     db: Session = Depends(get_db),
@@ -881,11 +1415,7 @@ async def create_list(
         raise HTTPException(status_code=404, detail="Board not found")
 
     # Calculate new position
-    max_position = (
-        db.query(TaskListModel)
-        .filter(TaskListModel.board_id == list_data.board_id)
-        .count()
-    )
+    max_position = count_board_lists(list_data.board_id, db)
 
     # Create new list
     new_list = TaskListModel(
@@ -893,8 +1423,8 @@ async def create_list(
     )
 
     db.add(new_list)
+    bump_board_versions(db, list_data.board_id)
     db.commit()
-    db.refresh(new_list)
 
     return {
         "id": new_list.id,
@@ -906,37 +1436,28 @@ async def create_list(
 
 
 @app.post("/api/cards", response_model=Card)
-async def create_card(
+def create_card(
     card_data: CardCreate,
     current_user: UserModel = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
     """Create a new card"""
     # Verify the list exists and user has access
-    task_list = (
-        db.query(TaskListModel).filter(TaskListModel.id == card_data.list_id).first()
+    board_id = (
+        db.query(TaskListModel.board_id)
+        .filter(TaskListModel.id == card_data.list_id)
+        .scalar()
     )
-    if not task_list:
+    if board_id is None:
         raise HTTPException(status_code=404, detail="List not found")
 
-    if not has_board_access(current_user.id, task_list.board_id, db):
+    if not has_board_access(current_user.id, board_id, db):
         raise HTTPException(status_code=404, detail="Board not found")
 
     # Calculate new position (last in the list)
-    max_position = (
-        db.query(CardModel).filter(CardModel.list_id == card_data.list_id).count()
-    )
+    max_position = count_list_cards(card_data.list_id, db)
 
     # Create new card
-    from models import Priority
-
-    priority_enum = Priority.MEDIUM  # default
-    if card_data.priority:
-        try:
-            priority_enum = Priority(card_data.priority)
-        except ValueError:
-            priority_enum = Priority.MEDIUM
-
     new_card = CardModel(
         title=card_data.title,
         description=card_data.description,
@@ -944,37 +1465,32 @@ async def create_card(
         position=max_position,
         created_by=current_user.id,
         checklist=[],
-        priority=priority_enum,
+        priority=card_data.priority,
     )
 
     db.add(new_card)
-    db.commit()
-    db.refresh(new_card)
+    db.flush()  # Assigns new_card.id without ending the transaction
 
     # Add creator as contributor
     contributor = CardContributorModel(card_id=new_card.id, user_id=current_user.id)
     db.add(contributor)
+    bump_board_versions(db, board_id)
     db.commit()
 
-    return build_card_data(new_card, db)
+    return get_card_with_details(new_card.id, db)
 
 
 @app.put("/api/cards/{card_id}", response_model=Card)
-async def update_card(
+def update_card(
     card_id: int,
     card_update: CardUpdate,
     current_user: UserModel = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
     """Update a card"""
-    card = db.query(CardModel).filter(CardModel.id == card_id).first()
-    if not card:
-        raise HTTPException(status_code=404, detail="Card not found")
-
-    # Check board access
-    task_list = db.query(TaskListModel).filter(TaskListModel.id == card.list_id).first()
-    if not has_board_access(current_user.id, task_list.board_id, db):
-        raise HTTPException(status_code=404, detail="Board not found")
+    card = resolve_card_with_access(
+        card_id, current_user.id, db, *card_detail_options()
+    )
 
     # Update card fields
     if card_update.title is not None:
@@ -984,107 +1500,43 @@ async def update_card(
     if card_update.checklist is not None:
         card.checklist = card_update.checklist
     if card_update.priority is not None:
-        from models import Priority
+        card.priority = card_update.priority
 
-        try:
-            card.priority = Priority(card_update.priority)
-        except ValueError:
-            card.priority = Priority.MEDIUM
-
-    card.updated_at = datetime.utcnow()
+    card.updated_at = func.now()
 
     # Add user as contributor if not already
-    existing_contributor = (
-        db.query(CardContributorModel)
-        .filter(
-            CardContributorModel.card_id == card_id,
-            CardContributorModel.user_id == current_user.id,
-        )
-        .first()
-    )
-
-    if not existing_contributor:
-        contributor = CardContributorModel(card_id=card_id, user_id=current_user.id)
-        db.add(contributor)
+    add_card_contributor(db, card_id, current_user.id)
+    bump_board_versions(db, card.task_list.board_id)
 
     db.commit()
-    db.refresh(card)
-
-    return build_card_data(card, db)
-
-
-def build_card_data(card: CardModel, db: Session):
-    """Build complete card data with creator and contributors"""
-    # Get contributors
-    contributors = []
-    contributor_records = (
-        db.query(CardContributorModel)
-        .filter(CardContributorModel.card_id == card.id)
-        .all()
-    )
-    for contrib in contributor_records:
-        contributors.append(
-            {
-                "id": contrib.user.id,
-                "username": contrib.user.username,
-                "full_name": contrib.user.full_name,
-                "avatar_url": contrib.user.avatar_url,
-                "contributed_at": contrib.contributed_at.isoformat(),
-            }
-        )
 
-    return {
-        "id": card.id,
-        "title": card.title,
-        "description": card.description,
-        "list_id": card.list_id,
-        "position": card.position,
-        "checklist": card.checklist or [],
-        "priority": card.priority.value if card.priority else "medium",
-        "created_at": card.created_at.isoformat(),
-        "updated_at": card.updated_at.isoformat(),
-        "creator": {
-            "id": card.creator.id,
-            "username": card.creator.username,
-            "email": card.creator.email,
-            "full_name": card.creator.full_name,
-            "avatar_url": card.creator.avatar_url,
-            "is_active": card.creator.is_active,
-        },
-        "contributors": contributors,
-    }
+    return get_card_with_details(card_id, db)
 
 
 @app.put("/api/cards/{card_id}/move", response_model=Card)
-async def move_card(
+def move_card(
     card_id: int,
     move_data: MoveCard,
     current_user: UserModel = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
     """Move a card to a different list or position"""
-    # Find the card and verify access
-    card = db.query(CardModel).filter(CardModel.id == card_id).first()
-    if not card:
-        raise HTTPException(status_code=404, detail="Card not found")
-
-    # Verify access to source board
-    source_list = (
-        db.query(TaskListModel).filter(TaskListModel.id == card.list_id).first()
+    # Find the card (joined with its list) and verify access to its board
+    card = resolve_card_with_access(
+        card_id, current_user.id, db, *card_detail_options()
     )
-    if not has_board_access(current_user.id, source_list.board_id, db):
-        raise HTTPException(status_code=404, detail="Board not found")
+    source_board_id = card.task_list.board_id
 
     # Verify target list exists and belongs to same board
-    target_list = (
-        db.query(TaskListModel)
+    target_board_id = (
+        db.query(TaskListModel.board_id)
         .filter(TaskListModel.id == move_data.new_list_id)
-        .first()
+        .scalar()
     )
-    if not target_list:
+    if target_board_id is None:
         raise HTTPException(status_code=404, detail="Target list not found")
 
-    if source_list.board_id != target_list.board_id:
+    if source_board_id != target_board_id:
         raise HTTPException(
             status_code=400, detail="Cannot move cards between different boards"
         )
@@ -1092,61 +1544,80 @@ async def move_card(
     old_list_id = card.list_id
     old_position = card.position
 
-    # Update positions of other cards
-    if old_list_id != move_data.new_list_id:
-        # Move cards up in the old list
-        db.query(CardModel).filter(
-            CardModel.list_id == old_list_id, CardModel.position > old_position
-        ).update({"position": CardModel.position - 1})
-
-        # Move cards down in the new list to make room
-        db.query(CardModel).filter(
-            CardModel.list_id == move_data.new_list_id,
-            CardModel.position >= move_data.new_position,
-        ).update({"position": CardModel.position + 1})
-    else:
-        # Moving within the same list
-        if move_data.new_position > old_position:
-            # Moving down in the list
-            db.query(CardModel).filter(
-                CardModel.list_id == old_list_id,
-                CardModel.position > old_position,
-                CardModel.position <= move_data.new_position,
-            ).update({"position": CardModel.position - 1})
-        elif move_data.new_position < old_position:
-            # Moving up in the list
-            db.query(CardModel).filter(
-                CardModel.list_id == old_list_id,
-                CardModel.position >= move_data.new_position,
-                CardModel.position < old_position,
-            ).update({"position": CardModel.position + 1})
-
-    # Update the card
-    card.list_id = move_data.new_list_id
-    card.position = move_data.new_position
+    # Move the card and update positions of other cards
+    reposition_card(
+        db,
+        card_id,
+        old_list_id,
+        old_position,
+        move_data.new_list_id,
+        move_data.new_position,
+    )
 
     # Add user as contributor for moving the card
-    existing_contributor = (
+    add_card_contributor(db, card_id, current_user.id)
+    bump_board_versions(db, source_board_id)
+
+    db.commit()
+
+    return get_card_with_details(card_id, db)
+
+
+@app.get("/api/cards/{card_id}/contributors", response_model=ContributorPage)
+def get_card_contributors(
+    card_id: int,
+    contrib_after: Optional[datetime] = None,
+    contrib_after_id: Optional[int] = None,
+    limit: int = Query(50, ge=1, le=100),
+    current_user: UserModel = Depends(get_current_active_user),
+    db: Session = Depends(get_db),
+):
+    """Page through a card's contributors, most recent first
+
+    Pass the previous page's ``next_after`` and ``next_after_id`` as
+    ``contrib_after`` and ``contrib_after_id`` to get the next page.
+    """
+    resolve_card_with_access(card_id, current_user.id, db)
+
+    query = (
         db.query(CardContributorModel)
-        .filter(
-            CardContributorModel.card_id == card_id,
-            CardContributorModel.user_id == current_user.id,
+        .options(joinedload(CardContributorModel.user))
+        .filter(CardContributorModel.card_id == card_id)
+    )
+    if contrib_after is not None and contrib_after_id is not None:
+        # Keyset on (contributed_at, id) so rows sharing the boundary
+        # timestamp aren't skipped
+        query = query.filter(
+            tuple_(CardContributorModel.contributed_at, CardContributorModel.id)
+            < tuple_(contrib_after, contrib_after_id)
         )
-        .first()
+    elif contrib_after is not None:
+        query = query.filter(CardContributorModel.contributed_at < contrib_after)
+    contributors = (
+        query.order_by(
+            CardContributorModel.contributed_at.desc(), CardContributorModel.id.desc()
+        )
+        .limit(limit)
+        .all()
     )
 
-    if not existing_contributor:
-        contributor = CardContributorModel(card_id=card_id, user_id=current_user.id)
-        db.add(contributor)
-
-    db.commit()
-    db.refresh(card)
+    total = (
+        db.query(func.count(CardContributorModel.id))
+        .filter(CardContributorModel.card_id == card_id)
+        .scalar()
+    )
 
-    return build_card_data(card, db)
+    last = contributors[-1] if len(contributors) == limit else None
+    return {
+        "contributors": contributors,
+        "total": total,
+        "next_after": last.contributed_at if last else None,
+        "next_after_id": last.id if last else None,
+    }
 
 
 @app.delete("/api/boards/{board_id}")
-async def delete_board(
+def delete_board(
     board_id: int,
     current_user: UserModel = Depends(get_current_active_user),
     db: Session = Depends(get_db),
@@ -1167,7 +1638,7 @@ async def delete_board(
 
 
 @app.delete("/api/lists/{list_id}")
-async def delete_list(
+def delete_list(
     list_id: int,
     current_user: UserModel = Depends(get_current_active_user),
     db: Session = Depends(get_db),
@@ -1181,28 +1652,23 @@ async def delete_list(
         raise HTTPException(status_code=404, detail="Board not found")
 
     db.delete(task_list)
+    bump_board_versions(db, task_list.board_id)
     db.commit()
 
     return {"message": "List deleted successfully"}
 
 
 @app.delete("/api/cards/{card_id}")
-async def delete_card(
+def delete_card(
     card_id: int,
     current_user: UserModel = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
     """Delete a card"""
-    card = db.query(CardModel).filter(CardModel.id == card_id).first()
-    if not card:
-        raise HTTPException(status_code=404, detail="Card not found")
-
-    # Verify access
-    task_list = db.query(TaskListModel).filter(TaskListModel.id == card.list_id).first()
-    if not has_board_access(current_user.id, task_list.board_id, db):
-        raise HTTPException(status_code=404, detail="Board not found")
+    card = resolve_card_with_access(card_id, current_user.id, db)
 
     db.delete(card)
+    bump_board_versions(db, card.task_list.board_id)
     db.commit()
 
     return {"message": "Card deleted successfully"}
@@ -1231,92 +1697,116 @@ async def chatbot_query(
         )
 
 
-async def process_chatbot_query(
-    message: str,
-    conversation_history: Optional[List[ChatMessage]],
-    current_board_context: Optional[CurrentBoardContext],
-    user: UserModel,
-    db: Session,
-) -> ChatbotResponse:
-    """Process natural language queries using OpenAI function calling with conversation memory and current board context"""
-
-    if not openai_client:
-        return ChatbotResponse(
-            message="I'm sorry, but I need an OpenAI API key to provide intelligent responses. Please contact the administrator."
+@app.post("/api/chatbot/stream")
+async def chatbot_query_stream(
+    query: ChatbotQuery,
+    current_user: UserModel = Depends(get_current_active_user),
+    db: Session = Depends(get_db),
+):
+    """Process chatbot queries and stream the reply as Server-Sent Events"""
+    try:
+        events = await stream_chatbot_query(
+            query.message,
+            query.conversation_history,
+            query.current_board_context,
+            current_user,
+            db,
+        )
+    except Exception as e:
+        events = chatbot_response_events(
+            ChatbotResponse(
+                message="I'm sorry, I encountered an error processing your request. Please try again.",
+                action="error",
+            )
         )
 
-    try:
-        # Build current board context information for the AI
-        board_context_info = ""
-        if current_board_context and current_board_context.board_id:
-            board_context_info = f"""
-CURRENT BOARD CONTEXT:
-You are currently working with the "{current_board_context.board_title}" board.
-Board ID: {current_board_context.board_id}
-Board Description: {current_board_context.board_description or "No description"}
-Board Type: {"Shared" if current_board_context.is_shared else "Personal"}
-Total Cards: {current_board_context.total_cards or 0}
-Members: {len(current_board_context.members or [])}
-Created: {current_board_context.created_at or "Unknown"}
-Last Updated: {current_board_context.updated_at or "Unknown"}
+    # Content-Encoding is set so GZipMiddleware passes the events through
+    # unbuffered instead of compressing the stream
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Content-Encoding": "identity",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+PRIORITY_ICONS = {"high": "🔴", "medium": "🟡", "low": "🟢"}
+
+
+def build_board_context_info(
+    current_board_context: Optional[CurrentBoardContext],
+) -> str:
+    """Render the current board context as text for the chatbot prompt"""
+    if not (current_board_context and current_board_context.board_id):
+        return """
+CURRENT BOARD CONTEXT: 
+No board is currently selected. User needs to select a board first or you should help them create one.
+"""
+
+    # Collect fragments and join once; repeated += is quadratic on big boards
+    parts = [
+        f"""
+CURRENT BOARD CONTEXT:
+You are currently working with the "{current_board_context.board_title}" board.
+Board ID: {current_board_context.board_id}
+Board Description: {current_board_context.board_description or "No description"}
+Board Type: {"Shared" if current_board_context.is_shared else "Personal"}
+Total Cards: {current_board_context.total_cards or 0}
+Members: {len(current_board_context.members or [])}
+Created: {current_board_context.created_at or "Unknown"}
+Last Updated: {current_board_context.updated_at or "Unknown"}
 
 DETAILED BOARD LAYOUT:
 """
-            # Add detailed list and card information
-            for lst in current_board_context.lists or []:
-                if isinstance(lst, dict):
-                    list_title = lst.get("title", "Unknown List")
-                    cards_count = lst.get("cards_count", 0)
-                    board_context_info += (
-                        f"\n📋 List: '{list_title}' ({cards_count} cards)\n"
-                    )
-
-                    if (
-                        "cards" in lst
-                        and lst["cards"]
-                        and isinstance(lst["cards"], list)
-                    ):
-                        for i, card in enumerate(
-                            lst["cards"][:10]
-                        ):  # Show first 10 cards per list
-                            if isinstance(card, dict):
-                                card_title = card.get("title", "Unknown Card")
-                                card_priority = card.get("priority", "medium")
-                                card_description = card.get("description", "")
-                                card_id = card.get("id", "Unknown")
-
-                                priority_icon = (
-                                    "🔴"
-                                    if card_priority == "high"
-                                    else "🟡" if card_priority == "medium" else "🟢"
-                                )
-                                board_context_info += (
-                                    f"   {i+1}. {priority_icon} '{card_title}'"
-                                )
-                                if card_description:
-                                    desc_preview = card_description[:50]
-                                    if len(card_description) > 50:
-                                        desc_preview += "..."
-                                    board_context_info += f" - {desc_preview}"
-                                board_context_info += f" (ID: {card_id})\n"
-
-                        if cards_count > 10:
-                            board_context_info += (
-                                f"   ... and {cards_count - 10} more cards\n"
-                            )
-                    else:
-                        board_context_info += "   (No cards)\n"
-
-            if current_board_context.recent_cards:
-                board_context_info += "\nRECENT ACTIVITY:\n"
-                for card in current_board_context.recent_cards[:5]:  # Show last 5 cards
-                    if isinstance(card, dict):
-                        card_title = card.get("title", "Unknown Card")
-                        list_name = card.get("list_name", "Unknown List")
-                        created_at = card.get("created_at", "Unknown")
-                        board_context_info += f"- '{card_title}' in '{list_name}' list (Created: {created_at})\n"
-
-            board_context_info += """
+    ]
+
+    # Add detailed list and card information
+    for lst in current_board_context.lists or []:
+        if not isinstance(lst, dict):
+            continue
+        list_title = lst.get("title", "Unknown List")
+        cards_count = lst.get("cards_count", 0)
+        parts.append(f"\n📋 List: '{list_title}' ({cards_count} cards)\n")
+
+        cards = lst.get("cards")
+        if not (cards and isinstance(cards, list)):
+            parts.append("   (No cards)\n")
+            continue
+
+        # Show first 10 cards per list
+        for i, card in enumerate(cards[:10]):
+            if not isinstance(card, dict):
+                continue
+            card_title = card.get("title", "Unknown Card")
+            card_description = card.get("description", "")
+            priority_icon = PRIORITY_ICONS.get(card.get("priority", "medium"), "🟢")
+            parts.append(f"   {i+1}. {priority_icon} '{card_title}'")
+            if card_description:
+                desc_preview = card_description[:50]
+                if len(card_description) > 50:
+                    desc_preview += "..."
+                parts.append(f" - {desc_preview}")
+            parts.append(f" (ID: {card.get('id', 'Unknown')})\n")
+
+        if cards_count > 10:
+            parts.append(f"   ... and {cards_count - 10} more cards\n")
+
+    if current_board_context.recent_cards:
+        parts.append("\nRECENT ACTIVITY:\n")
+        for card in current_board_context.recent_cards[:5]:  # Show last 5 cards
+            if isinstance(card, dict):
+                card_title = card.get("title", "Unknown Card")
+                list_name = card.get("list_name", "Unknown List")
+                created_at = card.get("created_at", "Unknown")
+                parts.append(
+                    f"- '{card_title}' in '{list_name}' list (Created: {created_at})\n"
+                )
+
+    parts.append(
+        """
 CONTEXT-AWARE CAPABILITIES:
 With this detailed board layout, you can now:
 - Answer questions about specific cards without function calls (e.g., "What's in the To Do list?")
@@ -1336,160 +1826,166 @@ IMPORTANT CONTEXT RULES:
 - Use the detailed card information to answer questions without function calls when possible
 - Reference specific card IDs when suggesting actions on cards
 """
-        else:
-            board_context_info = """
-CURRENT BOARD CONTEXT: 
-No board is currently selected. User needs to select a board first or you should help them create one.
+    )
+    return "".join(parts)
+
+
+def build_chatbot_messages(
+    message: str,
+    conversation_history: Optional[List[ChatMessage]],
+    current_board_context: Optional[CurrentBoardContext],
+    user: UserModel,
+) -> List[dict]:
+    """Build the OpenAI messages for a chatbot turn"""
+    board_context_info = build_board_context_info(current_board_context)
+
+    # Only the user/board specific part of the prompt is built per request;
+    # it follows the static prefix so the provider can cache the prefix
+    current_board_title = (
+        current_board_context.board_title if current_board_context else "current"
+    )
+    current_list_titles = (
+        ", ".join([lst["title"] for lst in (current_board_context.lists or [])])
+        if current_board_context
+        else "various lists"
+    )
+    context_message = f"""You're helping user '{user.username}' manage their work.
+{board_context_info}
+EXAMPLES FOR THE CURRENT BOARD:
+❌ "I need more information about which board"
+✅ "I'll add that to your '{current_board_title}' board! Which list would you like me to add it to? You have: {current_list_titles}"
+
+❌ "List not found"
+✅ "I couldn't find a list called 'todoo' but I see you have a 'To Do' list in your {current_board_title} board. Should I add it there?"
 """
 
-        # Create comprehensive system message with current board context
-        system_message = f"""You are a helpful AI assistant for Task Tiles, a Kanban-style task management system. 
-        You're helping user '{user.username}' manage their work.
-
-        IMPORTANT TERMINOLOGY:
-        - **BOARD**: A workspace/project container (like "Marketing Campaign" or "Personal Projects")
-        - **LIST**: A column within a board representing workflow stages (like "To Do", "In Progress", "Done")
-        - **CARD/TASK**: Individual work items within lists (like "Write blog post" or "Fix login bug")
-
-        HIERARCHY: Board → Lists → Cards/Tasks
-        Example: "Marketing Campaign" board has lists "Ideas", "In Progress", "Review", "Published"
-
-        {board_context_info}
-
-        YOUR PERSONALITY:
-        - Be conversational and friendly
-        - Use emojis to make responses engaging
-        - Always ask for clarification when information is missing
-        - Explain what you're doing and why
-        - Provide helpful suggestions
-        - Remember our conversation context and refer back to previous messages when relevant
-        - Use the current board context to resolve ambiguous references
-
-        CONVERSATION MEMORY:
-        - You can reference previous messages in our conversation
-        - Build on previous context when users make follow-up requests
-        - If a user says "add another one" or "do the same for X", use previous context
-        - Remember user preferences and workflow patterns from the conversation
-
-        SMART CONTEXT RESOLUTION:
-        - When user mentions a list name, first try to find it in the CURRENT board
-        - Handle typos by finding the closest match (e.g., "todoo" → "To Do", "bugs" → "Bug Fixes")
-        - For ambiguous references, use current board context and conversation history
-        - If user doesn't specify a board, assume they mean the current board
-        - Only ask for clarification if you can't reasonably determine what they mean
-
-        ENHANCED CONTEXT AWARENESS:
-        - Use the detailed board layout information provided to answer questions directly
-        - When user asks "What's in my To Do list?" - list the specific cards from the board context
-        - When user asks "Summarize my tasks" or "Summarize the board" - provide a comprehensive summary using the detailed board info
-        - When user asks "What are my high priority tasks?" - identify and list high priority cards
-        - When user asks "How many tasks do I have?" - count cards from the detailed board layout
-        - When user asks "What's in Study Guide?" - look at the board context and list all cards in that list
-        - Reference specific card IDs when suggesting actions (e.g., "You could move card #123 to Done")
-        - Always check the DETAILED BOARD LAYOUT section above for complete card and list information
-        - NEVER say you can't summarize or don't have access to board content when detailed context is provided
-
-        SUMMARIZATION GUIDELINES:
-        - Use the detailed board context provided in the system message to answer summary questions
-        - When asked to summarize a specific list, extract that list's cards from the board context
-        - When asked to summarize the board, provide an overview of all lists and their contents
-        - Include card titles, priorities, and descriptions in summaries
-        - Count tasks accurately using the provided context data
-
-        WHEN TO USE FUNCTION CALLS vs DIRECT RESPONSES:
-        - Use DIRECT RESPONSES for: queries about board content, summaries, counts, priority identification
-        - Use FUNCTION CALLS for: creating, moving, deleting, or modifying board items
-        - If you have the information in the board context, answer directly without function calls
-        - Only use function calls when you need to perform an action or get information not in the current context
-
-        WHEN TO ASK FOR CLARIFICATION:
-        - User says "create a task" but current board has no lists
-        - User mentions a list that doesn't exist in current board and you can't find a close match
-        - User asks about "tasks" but doesn't specify timeframe or location
-        - Truly ambiguous requests that can't be resolved with current context
-
-        RESPONSE STYLE:
-        - Start with a friendly acknowledgment
-        - If you need more info, ask specific questions with examples from the current board
-        - If you can help, explain what you're doing and which board/list you're using
-        - Use board/list/card terminology consistently
-        - Reference current board context naturally
-        - Handle typos gracefully without making a big deal about them
-        - When providing summaries or lists, use the detailed board information
-        - Include specific card names, priorities, and descriptions when relevant
-
-        EXAMPLES OF ENHANCED CONTEXT-AWARE RESPONSES:
-        ❌ "I need more information about which board"
-        ✅ "I'll add that to your '{current_board_context.board_title if current_board_context else 'current'}' board! Which list would you like me to add it to? You have: {', '.join([lst['title'] for lst in (current_board_context.lists or [])]) if current_board_context else 'various lists'}"
-
-        ❌ "List not found"
-        ✅ "I couldn't find a list called 'todoo' but I see you have a 'To Do' list in your {current_board_context.board_title if current_board_context else 'current'} board. Should I add it there?"
-
-        ❌ "I need to call a function to see your tasks"
-        ✅ "Looking at your current board, I can see you have 5 tasks in your To Do list: 1. 🔴 'Fix login bug' (high priority), 2. 🟡 'Update homepage'..."
-
-        ❌ "Let me get your board information"
-        ✅ "Based on your current board layout, you have 3 high priority tasks: 'Fix login bug' in To Do, 'Review PR' in In Progress, and 'Deploy hotfix' in Done."
-
-        Always be helpful and use the current board context to make interactions as smooth as possible."""
-
-        # Build conversation messages including history
-        messages = [{"role": "system", "content": system_message}]
-
-        # Add conversation history (keep last 10 messages to avoid token limits)
-        recent_history = conversation_history[-10:] if conversation_history else []
-        for hist_msg in recent_history:
-            if hist_msg.role in ["user", "assistant"]:
-                messages.append({"role": hist_msg.role, "content": hist_msg.content})
-
-        # Add current message
-        messages.append({"role": "user", "content": message})
+    # Build conversation messages including history
+    messages = [
+        {"role": "system", "content": CHATBOT_SYSTEM_PROMPT},
+        {"role": "system", "content": context_message},
+    ]
 
-        # Make OpenAI API call with function calling
-        response = openai_client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=messages,
-            functions=CHATBOT_FUNCTIONS,
-            function_call="auto",
-            temperature=0.7,
-            max_tokens=1000,  # Increased for more detailed context-aware responses
+    # Add conversation history (keep last 10 messages to avoid token limits)
+    recent_history = conversation_history[-10:] if conversation_history else []
+    for hist_msg in recent_history:
+        if hist_msg.role in ["user", "assistant"]:
+            messages.append({"role": hist_msg.role, "content": hist_msg.content})
+
+    # Add current message
+    messages.append({"role": "user", "content": message})
+
+    return messages
+
+
+async def run_chatbot_function_call(
+    function_call,
+    messages: List[dict],
+    current_board_context: Optional[CurrentBoardContext],
+    user: UserModel,
+    db: Session,
+):
+    """Execute the function OpenAI asked for and build the follow-up messages"""
+    function_name = function_call.name
+    function_args = json.loads(function_call.arguments)
+
+    # Execute the requested function with current board context
+    function_result = await execute_chatbot_function(
+        function_name, function_args, current_board_context, user, db
+    )
+
+    # Build follow-up messages including the function call and result
+    follow_up_messages = messages + [
+        {
+            "role": "assistant",
+            "content": None,
+            "function_call": {
+                "name": function_name,
+                "arguments": json.dumps(function_args),
+            },
+        },
+        {
+            "role": "function",
+            "name": function_name,
+            "content": json.dumps(function_result),
+        },
+    ]
+
+    return function_result, follow_up_messages
+
+
+# Static request options, built once and shared by every chatbot turn.
+# The follow-up turn only acknowledges an action that already ran, so it
+# gets a much smaller token budget than the first turn.
+CHATBOT_COMPLETION_KWARGS = {
+    "model": "gpt-3.5-turbo",
+    "functions": CHATBOT_FUNCTIONS,
+    "function_call": "auto",
+    "temperature": 0.7,
+    "max_tokens": 1000,  # Increased for more detailed context-aware responses
+}
+CHATBOT_FOLLOW_UP_KWARGS = {
+    "model": "gpt-3.5-turbo",
+    "temperature": 0.7,
+    "max_tokens": 300,
+}
+
+
+async def request_chatbot_completion(messages: List[dict]):
+    """First chatbot turn, letting OpenAI decide whether to call a function"""
+    response = await openai_client.chat.completions.create(
+        messages=messages, **CHATBOT_COMPLETION_KWARGS
+    )
+    return response.choices[0].message
+
+
+def chatbot_cache_key(user: UserModel, messages: List[dict]) -> str:
+    # The prompt embeds the user, board snapshot and history, so identical
+    # prompts can reuse a previous direct answer
+    return hashlib.sha1(
+        json.dumps([user.id, messages], sort_keys=True).encode()
+    ).hexdigest()
+
+
+async def process_chatbot_query(
+    message: str,
+    conversation_history: Optional[List[ChatMessage]],
+    current_board_context: Optional[CurrentBoardContext],
+    user: UserModel,
+    db: Session,
+) -> ChatbotResponse:
+    """Process natural language queries using OpenAI function calling with conversation memory and current board context"""
+
+    if not openai_client:
+        return ChatbotResponse(
+            message="I'm sorry, but I need an OpenAI API key to provide intelligent responses. Please contact the administrator."
         )
 
-        message_response = response.choices[0].message
+    try:
+        messages = build_chatbot_messages(
+            message, conversation_history, current_board_context, user
+        )
+
+        cache_key = chatbot_cache_key(user, messages)
+        cached_response = chatbot_response_cache.get(cache_key)
+        if cached_response is not None:
+            return cached_response
+
+        # Make OpenAI API call with function calling
+        message_response = await request_chatbot_completion(messages)
 
         # Check if OpenAI wants to call a function
         if message_response.function_call:
-            function_name = message_response.function_call.name
-            function_args = json.loads(message_response.function_call.arguments)
-
-            # Execute the requested function with current board context
-            function_result = await execute_chatbot_function(
-                function_name, function_args, current_board_context, user, db
+            function_result, follow_up_messages = await run_chatbot_function_call(
+                message_response.function_call,
+                messages,
+                current_board_context,
+                user,
+                db,
             )
 
-            # Build follow-up messages including the function call and result
-            follow_up_messages = messages + [
-                {
-                    "role": "assistant",
-                    "content": None,
-                    "function_call": {
-                        "name": function_name,
-                        "arguments": json.dumps(function_args),
-                    },
-                },
-                {
-                    "role": "function",
-                    "name": function_name,
-                    "content": json.dumps(function_result),
-                },
-            ]
-
             # Get a follow-up response from OpenAI that incorporates the function result
-            follow_up_response = openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=follow_up_messages,
-                temperature=0.7,
-                max_tokens=1000,
+            follow_up_response = await openai_client.chat.completions.create(
+                messages=follow_up_messages, **CHATBOT_FOLLOW_UP_KWARGS
             )
 
             return ChatbotResponse(
@@ -1498,8 +1994,11 @@ No board is currently selected. User needs to select a board first or you should
                 data=function_result.get("data"),
             )
         else:
-            # OpenAI provided a direct response without function calling
-            return ChatbotResponse(message=message_response.content)
+            # OpenAI provided a direct response without function calling.
+            # Function-calling turns are never cached since they act on data.
+            chatbot_response = ChatbotResponse(message=message_response.content)
+            chatbot_response_cache.set(cache_key, chatbot_response)
+            return chatbot_response
 
     except Exception as e:
         print(f"OpenAI API error: {e}")
@@ -1508,6 +2007,107 @@ No board is currently selected. User needs to select a board first or you should
         )
 
 
+def sse_event(payload: dict) -> str:
+    """Encode one Server-Sent Event; JSON keeps newlines in the text intact"""
+    return f"data: {json.dumps(payload)}\n\n"
+
+
+async def chatbot_response_events(chatbot_response: ChatbotResponse):
+    """Stream an already complete chatbot response as a single event"""
+    yield sse_event({"type": "delta", "content": chatbot_response.message})
+    yield sse_event({"type": "done", **chatbot_response.model_dump()})
+
+
+async def stream_follow_up_events(
+    follow_up_messages: List[dict], function_result: dict
+):
+    """Stream the follow-up turn token by token as it is generated"""
+    full_message = ""
+    try:
+        stream = await openai_client.chat.completions.create(
+            messages=follow_up_messages, stream=True, **CHATBOT_FOLLOW_UP_KWARGS
+        )
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            content = chunk.choices[0].delta.content
+            if content:
+                full_message += content
+                yield sse_event({"type": "delta", "content": content})
+    except Exception as e:
+        print(f"OpenAI API error: {e}")
+
+    # Whether the stream failed or just ended without any content, the client
+    # still needs some text to show
+    if not full_message:
+        full_message = "I'm having trouble processing your request right now. Please try again in a moment. 🤔"
+        yield sse_event({"type": "delta", "content": full_message})
+
+    yield sse_event(
+        {
+            "type": "done",
+            "message": full_message,
+            "action": function_result.get("action"),
+            "data": function_result.get("data"),
+        }
+    )
+
+
+async def stream_chatbot_query(
+    message: str,
+    conversation_history: Optional[List[ChatMessage]],
+    current_board_context: Optional[CurrentBoardContext],
+    user: UserModel,
+    db: Session,
+):
+    """Like process_chatbot_query, but returns an async iterator of SSE events.
+
+    The first (function-calling) turn and any database work happen before the
+    response starts, so the request's session is not used while streaming.
+    Only the follow-up turn after a function call is streamed.
+    """
+    if not openai_client:
+        return chatbot_response_events(
+            ChatbotResponse(
+                message="I'm sorry, but I need an OpenAI API key to provide intelligent responses. Please contact the administrator."
+            )
+        )
+
+    try:
+        messages = build_chatbot_messages(
+            message, conversation_history, current_board_context, user
+        )
+
+        cache_key = chatbot_cache_key(user, messages)
+        cached_response = chatbot_response_cache.get(cache_key)
+        if cached_response is not None:
+            return chatbot_response_events(cached_response)
+
+        message_response = await request_chatbot_completion(messages)
+
+        if message_response.function_call:
+            function_result, follow_up_messages = await run_chatbot_function_call(
+                message_response.function_call,
+                messages,
+                current_board_context,
+                user,
+                db,
+            )
+            return stream_follow_up_events(follow_up_messages, function_result)
+
+        chatbot_response = ChatbotResponse(message=message_response.content)
+        chatbot_response_cache.set(cache_key, chatbot_response)
+        return chatbot_response_events(chatbot_response)
+
+    except Exception as e:
+        print(f"OpenAI API error: {e}")
+        return chatbot_response_events(
+            ChatbotResponse(
+                message="I'm having trouble processing your request right now. Please try again in a moment. 🤔"
+            )
+        )
+
+
 async def execute_chatbot_function(
     function_name: str,
     args: dict,
@@ -1587,17 +2187,91 @@ async def execute_chatbot_function(
             return {"status": "error", "message": f"Unknown function: {function_name}"}
 
     except Exception as e:
+        db.rollback()
         return {
             "status": "error",
             "message": f"Error executing {function_name}: {str(e)}",
         }
 
 
+def find_current_board(
+    user_boards, current_board_context: Optional[CurrentBoardContext]
+):
+    """The board the user is viewing, or None if they aren't viewing one"""
+    if not (current_board_context and current_board_context.board_id):
+        return None
+    return next(
+        (board for board in user_boards if board.id == current_board_context.board_id),
+        None,
+    )
+
+
+def preview_list(items, limit: int = 3) -> str:
+    """Join the first few items for a suggestion, with "..." if there are more"""
+    preview = ", ".join(items[:limit])
+    return preview + "..." if len(items) > limit else preview
+
+
+def lower_title(item) -> str:
+    """An ORM object's lowercased title, precomputed by get_chatbot_boards"""
+    title_lower = getattr(item, "_title_lower", None)
+    if title_lower is None:
+        title_lower = item.title.lower()
+    return title_lower
+
+
+def index_by_lower_title(items, key=lower_title) -> dict:
+    """Map lowercased titles to items for exact, case-insensitive lookups
+
+    The first item wins when several share a title, matching a linear scan.
+    """
+    index = {}
+    for item in items:
+        index.setdefault(key(item), item)
+    return index
+
+
+@lru_cache(maxsize=512)
+def closest_title_index(query: str, lowered_titles: tuple) -> Optional[int]:
+    """Index of the lowercased title closest to query, or None
+
+    A ratio of 60 needs the shorter string to be at least 3/7 the length of
+    the longer one, so titles failing that are dropped before scoring.
+    Cached because the chatbot sees the same typo against the same titles
+    over and over while the user clarifies a request.
+    """
+    query_length = len(query)
+    candidates = {
+        index: lowered
+        for index, lowered in enumerate(lowered_titles)
+        if 7 * min(len(lowered), query_length) >= 3 * max(len(lowered), query_length)
+    }
+    match = process.extractOne(
+        query, candidates, scorer=fuzz.ratio, processor=None, score_cutoff=60
+    )
+    return match[2] if match else None
+
+
+def find_close_match(
+    name: str, titles: List[str], lowered_titles: Optional[List[str]] = None
+) -> Optional[str]:
+    """Return the title most similar to name, or None if nothing is close
+
+    Titles are compared case-insensitively by plain ratio. Pass
+    ``lowered_titles`` (e.g. from ``lower_title``) to skip lowercasing them
+    again.
+    """
+    if lowered_titles is None:
+        lowered_titles = [title.lower() for title in titles]
+    index = closest_title_index(name.lower(), tuple(lowered_titles))
+    return titles[index] if index is not None else None
+
+
 # Updated function implementations for OpenAI integration
 async def get_user_boards_function(user: UserModel, db: Session) -> dict:
     """Get user's boards for OpenAI function calling"""
     try:
-        user_boards = get_user_boards(user.id, db)
+        user_boards = get_chatbot_boards(user, db)
 
         if not user_boards:
             return {
@@ -1608,19 +2282,29 @@ async def get_user_boards_function(user: UserModel, db: Session) -> dict:
                 "action": "show_boards",
             }
 
+        # Boards with members are shared, as in build_board_data; count them
+        # in one query rather than loading each board's members
+        member_counts = dict(
+            db.query(BoardMemberModel.board_id, func.count(BoardMemberModel.id))
+            .filter(BoardMemberModel.board_id.in_([board.id for board in user_boards]))
+            .group_by(BoardMemberModel.board_id)
+            .all()
+        )
+
         boards_data = []
         for board in user_boards:
             lists_count = len(board.lists)
             cards_count = sum(len(lst.cards) for lst in board.lists)
+            member_count = member_counts.get(board.id, 0)
             boards_data.append(
                 {
                     "id": board.id,
                     "title": board.title,
                     "description": board.description,
-                    "type": "Shared" if board.is_shared else "Personal",
+                    "type": "Shared" if member_count > 0 else "Personal",
                     "lists": lists_count,
                     "cards": cards_count,
-                    "members": len(board.members) + 1 if board.is_shared else 1,
+                    "members": member_count + 1,
                 }
             )
 
@@ -1638,31 +2322,41 @@ async def get_user_boards_function(user: UserModel, db: Session) -> dict:
 async def get_todays_tasks_function(user: UserModel, db: Session) -> dict:
     """Get today's tasks for OpenAI function calling"""
     try:
-        user_boards = get_user_boards(user.id, db)
-        today = datetime.utcnow().date()
-        recent_cards = []
+        today_start = datetime.combine(datetime.utcnow().date(), dt_time.min)
+        tomorrow_start = today_start + timedelta(days=1)
+
+        # One query over every accessible board instead of walking the
+        # board -> list -> card relationships in Python
+        rows = (
+            db.query(CardModel, TaskListModel.title, BoardModel.title)
+            .join(TaskListModel, CardModel.list_id == TaskListModel.id)
+            .join(BoardModel, TaskListModel.board_id == BoardModel.id)
+            .filter(board_access_clause(user.id))
+            .filter(
+                or_(
+                    and_(
+                        CardModel.created_at >= today_start,
+                        CardModel.created_at < tomorrow_start,
+                    ),
+                    func.lower(CardModel.title).contains("today"),
+                    func.lower(CardModel.description).contains("today"),
+                )
+            )
+            .order_by(BoardModel.id, TaskListModel.position, CardModel.position)
+            .all()
+        )
 
-        for board in user_boards:
-            for task_list in board.lists:
-                for card in task_list.cards:
-                    card_date = card.created_at.date()
-                    has_today_keyword = (
-                        "today" in (card.title + " " + (card.description or "")).lower()
-                    )
-
-                    if card_date == today or has_today_keyword:
-                        recent_cards.append(
-                            {
-                                "id": card.id,
-                                "title": card.title,
-                                "board": board.title,
-                                "list": task_list.title,
-                                "created": card.created_at.strftime("%H:%M"),
-                                "priority": (
-                                    card.priority.value if card.priority else "medium"
-                                ),
-                            }
-                        )
+        recent_cards = [
+            {
+                "id": card.id,
+                "title": card.title,
+                "board": board_title,
+                "list": list_title,
+                "created": card.created_at.strftime("%H:%M"),
+                "priority": card.priority or "medium",
+            }
+            for card, list_title, board_title in rows
+        ]
 
         return {
             "status": "success",
@@ -1675,28 +2369,36 @@ async def get_todays_tasks_function(user: UserModel, db: Session) -> dict:
         return {"status": "error", "message": str(e)}
 
 
+def chatbot_write_failed(db: Session, error: SQLAlchemyError) -> dict:
+    """Roll back a chatbot function's failed write and report it"""
+    db.rollback()
+    print(f"Chatbot database error: {error}")
+    return {
+        "status": "error",
+        "message": "Sorry, I couldn't save that change. Please try again.",
+    }
+
+
 async def create_board_function(
     board_name: str, description: str, user: UserModel, db: Session
 ) -> dict:
     """Create board for OpenAI function calling"""
+    new_board = BoardModel(title=board_name, description=description, owner_id=user.id)
     try:
-        new_board = BoardModel(
-            title=board_name, description=description, owner_id=user.id
-        )
         db.add(new_board)
         db.commit()
-        db.refresh(new_board)
+    except SQLAlchemyError as e:
+        return chatbot_write_failed(db, e)
+    forget_chatbot_boards(user, db)
 
-        return {
-            "status": "success",
-            "message": f"Successfully created board '{board_name}'",
-            "board_id": new_board.id,
-            "board_name": board_name,
-            "action": "board_created",
-            "data": {"board_id": new_board.id, "board_name": board_name},
-        }
-    except Exception as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "message": f"Successfully created board '{board_name}'",
+        "board_id": new_board.id,
+        "board_name": board_name,
+        "action": "board_created",
+        "data": {"board_id": new_board.id, "board_name": board_name},
+    }
 
 
 async def create_list_function(
@@ -1707,116 +2409,101 @@ async def create_list_function(
     db: Session,
 ) -> dict:
     """Create list for OpenAI function calling with current board context awareness"""
-    try:
-        user_boards = get_user_boards(user.id, db)
+    user_boards = get_chatbot_boards(user, db)
 
-        if not user_boards:
-            return {
-                "status": "error",
-                "message": "You don't have any boards yet! You need to create a board first before adding lists.",
-                "suggestion": "Try saying 'Create a new board called [Board Name]' first!",
-            }
+    if not user_boards:
+        return {
+            "status": "error",
+            "message": "You don't have any boards yet! You need to create a board first before adding lists.",
+            "suggestion": "Try saying 'Create a new board called [Board Name]' first!",
+        }
 
-        # Prioritize current board context if available
-        target_board = None
+    # Prioritize current board context if available
+    target_board = None
 
-        # If user is viewing a board and doesn't specify a different board, use current board
-        if current_board_context and current_board_context.board_id and not board_name:
-            for board in user_boards:
-                if board.id == current_board_context.board_id:
-                    target_board = board
-                    break
-
-        # If board name is specified, try to find it
-        elif board_name:
-            # First try exact match
-            for board in user_boards:
-                if board.title.lower() == board_name.lower():
-                    target_board = board
-                    break
-
-            # If not found, try fuzzy matching
-            if not target_board:
-                import difflib
-
-                board_titles = [board.title for board in user_boards]
-                close_matches = difflib.get_close_matches(
-                    board_name, board_titles, n=1, cutoff=0.6
-                )
+    # If user is viewing a board and doesn't specify a different board, use current board
+    if current_board_context and current_board_context.board_id and not board_name:
+        target_board = find_current_board(user_boards, current_board_context)
 
-                if close_matches:
-                    # Found a close match
-                    for board in user_boards:
-                        if board.title == close_matches[0]:
-                            target_board = board
-                            break
-
-                    return {
-                        "status": "clarification",
-                        "message": f"I couldn't find a board called '{board_name}', but I found '{close_matches[0]}' which seems similar. Should I add the '{list_name}' list to '{close_matches[0]}'?",
-                        "suggested_board": close_matches[0],
-                        "action": "clarify_board",
-                    }
-                else:
-                    board_names = [board.title for board in user_boards]
-                    return {
-                        "status": "error",
-                        "message": f"I couldn't find a board called '{board_name}' 🤔",
-                        "available_boards": board_names,
-                        "suggestion": f"Did you mean one of these boards: {', '.join(board_names)}?",
-                    }
-        else:
-            # No board specified and no current context
-            if len(user_boards) == 1:
-                target_board = user_boards[0]
-            else:
-                board_names = [board.title for board in user_boards]
-                current_board_hint = ""
-                if current_board_context and current_board_context.board_title:
-                    current_board_hint = f" (you're currently viewing '{current_board_context.board_title}')"
+    # If board name is specified, try to find it
+    elif board_name:
+        # First try exact match
+        target_board = index_by_lower_title(user_boards).get(board_name.lower())
 
+        # If not found, try fuzzy matching
+        if not target_board:
+            board_titles = [board.title for board in user_boards]
+            close_match = find_close_match(
+                board_name, board_titles, [lower_title(b) for b in user_boards]
+            )
+
+            if close_match:
                 return {
-                    "status": "clarification_needed",
-                    "message": f"I'd be happy to create the '{list_name}' list! 📝 Which board would you like me to add it to{current_board_hint}?",
-                    "available_boards": board_names,
-                    "current_board": (
-                        current_board_context.board_title
-                        if current_board_context
-                        else None
-                    ),
-                    "suggestion": f"You have these boards: {', '.join(board_names)}. Just let me know which one!",
+                    "status": "clarification",
+                    "message": f"I couldn't find a board called '{board_name}', but I found '{close_match}' which seems similar. Should I add the '{list_name}' list to '{close_match}'?",
+                    "suggested_board": close_match,
+                    "action": "clarify_board",
                 }
+            else:
+                return {
+                    "status": "error",
+                    "message": f"I couldn't find a board called '{board_name}' 🤔",
+                    "available_boards": board_titles,
+                    "suggestion": f"Did you mean one of these boards: {', '.join(board_titles)}?",
+                }
+    else:
+        # No board specified and no current context
+        if len(user_boards) == 1:
+            target_board = user_boards[0]
+        else:
+            board_names = [board.title for board in user_boards]
+            current_board_hint = ""
+            if current_board_context and current_board_context.board_title:
+                current_board_hint = (
+                    f" (you're currently viewing '{current_board_context.board_title}')"
+                )
 
-        max_position = len(target_board.lists)
-        new_list = TaskListModel(
-            title=list_name, position=max_position, board_id=target_board.id
-        )
+            return {
+                "status": "clarification_needed",
+                "message": f"I'd be happy to create the '{list_name}' list! 📝 Which board would you like me to add it to{current_board_hint}?",
+                "available_boards": board_names,
+                "current_board": (
+                    current_board_context.board_title if current_board_context else None
+                ),
+                "suggestion": f"You have these boards: {', '.join(board_names)}. Just let me know which one!",
+            }
+
+    max_position = count_board_lists(target_board.id, db)
+    new_list = TaskListModel(
+        title=list_name, position=max_position, board_id=target_board.id
+    )
 
+    try:
         db.add(new_list)
+        bump_board_versions(db, target_board.id)
         db.commit()
-        db.refresh(new_list)
+    except SQLAlchemyError as e:
+        return chatbot_write_failed(db, e)
 
-        context_note = ""
-        if current_board_context and current_board_context.board_id == target_board.id:
-            context_note = " (your current board)"
+    context_note = ""
+    if current_board_context and current_board_context.board_id == target_board.id:
+        context_note = " (your current board)"
 
-        return {
-            "status": "success",
-            "message": f"Perfect! ✅ I've created the '{list_name}' list in your '{target_board.title}' board{context_note}",
+    return {
+        "status": "success",
+        "message": f"Perfect! ✅ I've created the '{list_name}' list in your '{target_board.title}' board{context_note}",
+        "list_id": new_list.id,
+        "list_name": list_name,
+        "board_name": target_board.title,
+        "board_id": target_board.id,
+        "action": "list_created",
+        "data": {
             "list_id": new_list.id,
             "list_name": list_name,
             "board_name": target_board.title,
             "board_id": target_board.id,
-            "action": "list_created",
-            "data": {
-                "list_id": new_list.id,
-                "list_name": list_name,
-                "board_name": target_board.title,
-                "board_id": target_board.id,
-            },
-        }
-    except Exception as e:
-        return {"status": "error", "message": str(e)}
+        },
+    }
 
 
 async def delete_list_function(
@@ -1827,113 +2514,238 @@ async def delete_list_function(
     db: Session,
 ) -> dict:
     """Delete a list for OpenAI function calling with current board context awareness"""
-    try:
-        user_boards = get_user_boards(user.id, db)
+    user_boards = get_chatbot_boards(user, db)
 
-        if not user_boards:
-            return {
-                "status": "error",
-                "message": "You don't have any boards yet! You need to create a board and list first.",
-                "suggestion": "Try saying 'Create a new board called [Board Name]' first!",
-            }
-
-        # Prioritize current board
-        current_board = None
-        if current_board_context and current_board_context.board_id:
-            for board in user_boards:
-                if board.id == current_board_context.board_id:
-                    current_board = board
-                    break
-
-        # If no current board, use first board
-        if not current_board:
-            current_board = user_boards[0]
-
-        # Find the list to delete
-        target_list = None
-
-        # First try exact match
-        for lst in current_board.lists:
-            if lst.title.lower() == list_name.lower():
-                target_list = lst
-                break
-
-        if not target_list:
-            # Try fuzzy matching
-            import difflib
+    if not user_boards:
+        return {
+            "status": "error",
+            "message": "You don't have any boards yet! You need to create a board and list first.",
+            "suggestion": "Try saying 'Create a new board called [Board Name]' first!",
+        }
 
-            list_titles = [lst.title for lst in current_board.lists]
-            close_matches = difflib.get_close_matches(
-                list_name, list_titles, n=1, cutoff=0.6
-            )
+    # Prioritize current board; if there isn't one, use the first board
+    current_board = (
+        find_current_board(user_boards, current_board_context) or user_boards[0]
+    )
 
-            if close_matches:
-                return {
-                    "status": "clarification",
-                    "message": f"I couldn't find a list called '{list_name}', but I found '{close_matches[0]}' which seems similar. Should I delete that list?",
-                    "suggested_list": close_matches[0],
-                    "suggested_board": current_board.title,
-                    "action": "clarify_list",
-                }
-            else:
-                available_lists = [lst.title for lst in current_board.lists]
-                return {
-                    "status": "error",
-                    "message": f"I couldn't find a list called '{list_name}' in your '{current_board.title}' board.",
-                    "available_lists": available_lists,
-                    "suggestion": f"Available lists: {', '.join(available_lists[:3])}{'...' if len(available_lists) > 3 else ''}",
-                }
+    # Find the list to delete, trying an exact match first
+    target_list = index_by_lower_title(current_board.lists).get(list_name.lower())
 
-        # Get the actual list from database
-        list_to_delete = (
-            db.query(TaskListModel).filter(TaskListModel.id == target_list.id).first()
+    if not target_list:
+        # Try fuzzy matching
+        list_titles = [lst.title for lst in current_board.lists]
+        close_match = find_close_match(
+            list_name, list_titles, [lower_title(lst) for lst in current_board.lists]
         )
 
-        if not list_to_delete:
+        if close_match:
             return {
-                "status": "error",
-                "message": f"List '{list_name}' not found.",
+                "status": "clarification",
+                "message": f"I couldn't find a list called '{list_name}', but I found '{close_match}' which seems similar. Should I delete that list?",
+                "suggested_list": close_match,
+                "suggested_board": current_board.title,
+                "action": "clarify_list",
             }
-
-        # Check if user has permission to delete (owner of board)
-        if not has_board_access(user.id, current_board.id, db):
+        else:
             return {
                 "status": "error",
-                "message": "You don't have permission to delete lists from this board.",
+                "message": f"I couldn't find a list called '{list_name}' in your '{current_board.title}' board.",
+                "available_lists": list_titles,
+                "suggestion": f"Available lists: {preview_list(list_titles)}",
             }
 
-        # Count cards that will be deleted
-        cards_count = (
-            db.query(CardModel).filter(CardModel.list_id == target_list.id).count()
-        )
+    list_to_delete = target_list
 
-        # Store list info before deletion
-        deleted_list_id = list_to_delete.id
-        deleted_list_title = list_to_delete.title
+    # Check if user has permission to delete (owner of board)
+    if not has_board_access(user.id, current_board.id, db):
+        return {
+            "status": "error",
+            "message": "You don't have permission to delete lists from this board.",
+        }
+
+    # Store list info before deletion
+    deleted_list_id = list_to_delete.id
+    deleted_list_title = list_to_delete.title
 
-        # Delete the list (this will cascade delete all cards in the list)
-        db.delete(list_to_delete)
+    try:
+        # Delete the list along with its cards, counting the cards as they go
+        cards_count = delete_list_with_cards(db, deleted_list_id)
+        bump_board_versions(db, list_to_delete.board_id)
         db.commit()
+    except SQLAlchemyError as e:
+        return chatbot_write_failed(db, e)
 
-        return {
-            "status": "success",
-            "message": f"Perfect! ✅ I've deleted the list '{deleted_list_title}' from the '{current_board.title}' board. This also deleted {cards_count} card(s) that were in the list.",
+    return {
+        "status": "success",
+        "message": f"Perfect! ✅ I've deleted the list '{deleted_list_title}' from the '{current_board.title}' board. This also deleted {cards_count} card(s) that were in the list.",
+        "list_id": deleted_list_id,
+        "list_name": deleted_list_title,
+        "board_name": current_board.title,
+        "board_id": current_board.id,
+        "cards_deleted": cards_count,
+        "action": "list_deleted",
+        "data": {
             "list_id": deleted_list_id,
             "list_name": deleted_list_title,
             "board_name": current_board.title,
             "board_id": current_board.id,
             "cards_deleted": cards_count,
-            "action": "list_deleted",
-            "data": {
-                "list_id": deleted_list_id,
-                "list_name": deleted_list_title,
-                "board_name": current_board.title,
-                "board_id": current_board.id,
-                "cards_deleted": cards_count,
-            },
+        },
+    }
+
+
+class ListInfo(NamedTuple):
+    """A list the chatbot can target, with its board"""
+
+    lst: TaskListModel
+    board: BoardModel
+    is_current: bool
+
+
+def iter_target_lists(user_boards, current_board):
+    """Yield every list the user can target, current board's lists first"""
+    if current_board:
+        for lst in current_board.lists:
+            yield ListInfo(lst, current_board, True)
+
+    # Add lists from other boards
+    for board in user_boards:
+        if not current_board or board.id != current_board.id:
+            for lst in board.lists:
+                yield ListInfo(lst, board, False)
+
+
+def no_lists_reply(current_board_context: Optional[CurrentBoardContext]) -> dict:
+    current_board_hint = ""
+    if current_board_context and current_board_context.board_title:
+        current_board_hint = f" in your '{current_board_context.board_title}' board"
+
+    return {
+        "status": "error",
+        "message": f"You don't have any lists yet{current_board_hint}! You need to create a list first before adding tasks.",
+        "suggestion": "Try saying 'Create a new list called To Do' first!",
+    }
+
+
+def ask_for_target_list(
+    user_boards,
+    current_board,
+    current_board_context: Optional[CurrentBoardContext],
+    request_phrase: str,
+    verb: str,
+) -> dict:
+    """Ask which list to use when none was named, current board first
+
+    ``request_phrase`` completes "I'd be happy to ..." and ``verb`` completes
+    "Which list should I ...", e.g. "move the card 'X'" and "move it to".
+    Only the current board's lists, or the first few lists overall, are
+    looked at.
+    """
+    if current_board and current_board.lists:
+        current_board_lists = [f"'{lst.title}'" for lst in current_board.lists]
+
+        return {
+            "status": "clarification_needed",
+            "message": f"I'd be happy to {request_phrase} for you! 📝 Which list in your '{current_board_context.board_title}' board should I {verb}?",
+            "available_lists": current_board_lists,
+            "current_board": current_board_context.board_title,
+            "suggestion": f"You have these lists in your current board: {', '.join(current_board_lists)}. Just let me know which one!",
         }
-    except Exception as e:
-        return {"status": "error", "message": str(e)}
+
+    # Multiple boards and lists
+    all_available_lists = [
+        f"'{info.lst.title}' (in {info.board.title})"
+        for info in islice(iter_target_lists(user_boards, current_board), 5)
+    ]
+    if not all_available_lists:
+        return no_lists_reply(current_board_context)
+
+    return {
+        "status": "clarification_needed",
+        "message": f"I'd be happy to {request_phrase} for you! 📝 Which list would you like me to {verb}?",
+        "available_lists": all_available_lists,
+        "suggestion": f"You have these lists: {preview_list(all_available_lists)}. Just let me know which one!",
+    }
+
+
+def resolve_target_list(
+    list_name: str,
+    target_lists,
+    current_board,
+    current_board_context: Optional[CurrentBoardContext],
+    verb: str,
+):
+    """Match list_name against target_lists, preferring the current board
+
+    Returns ``(list_info, None)`` on an exact match, otherwise
+    ``(None, reply)`` where reply suggests a close match or lists the
+    available lists. ``verb`` completes "Should I ...?" in the suggestion.
+    """
+    # Exact match; current board lists come first in target_lists, so
+    # they win over same-named lists on other boards
+    lists_by_lower = index_by_lower_title(
+        target_lists, key=lambda info: lower_title(info.lst)
+    )
+    target_list_info = lists_by_lower.get(list_name.lower())
+    if target_list_info:
+        return target_list_info, None
+
+    # Collect the titles once for the fuzzy match and the replies below
+    current_board_lists = []
+    all_lists = []
+    all_lists_lower = []
+    for info in target_lists:
+        all_lists.append(info.lst.title)
+        all_lists_lower.append(lower_title(info.lst))
+        if info.is_current:
+            current_board_lists.append(info.lst.title)
+
+    # Try fuzzy matching, current board lists first (they lead target_lists)
+    close_match = None
+    if current_board_lists:
+        close_match = find_close_match(
+            list_name,
+            current_board_lists,
+            all_lists_lower[: len(current_board_lists)],
+        )
+
+    # If no good match in current board, try all lists
+    if not close_match:
+        close_match = find_close_match(list_name, all_lists, all_lists_lower)
+
+    if close_match:
+        match_info = next(
+            info for info in target_lists if info.lst.title == close_match
+        )
+        if match_info.is_current:
+            board_hint = " (in your current board)"
+        else:
+            board_hint = f" (in '{match_info.board.title}')"
+
+        return None, {
+            "status": "clarification",
+            "message": f"I couldn't find a list called '{list_name}', but I found '{close_match}'{board_hint} which seems similar. Should I {verb}?",
+            "suggested_list": close_match,
+            "suggested_board": match_info.board.title,
+            "action": "clarify_list",
+        }
+
+    # No close match found
+    current_board_lists_str = ""
+    if current_board and current_board_context and current_board_lists:
+        current_board_lists_str = f" In your current board '{current_board_context.board_title}', you have: {', '.join(current_board_lists)}."
+
+    all_available_lists = [
+        f"'{info.lst.title}' (in {info.board.title})"
+        for info in target_lists[:5]  # Show first 5 to avoid overwhelming
+    ]
+
+    return None, {
+        "status": "error",
+        "message": f"I couldn't find a list called '{list_name}' 🤔{current_board_lists_str}",
+        "available_lists": all_available_lists,
+        "suggestion": f"Available lists: {preview_list(all_available_lists)}",
+    }
 
 
 async def create_card_function(
@@ -1946,236 +2758,128 @@ async def create_card_function(
     db: Session,
 ) -> dict:
     """Create card for OpenAI function calling with current board context awareness"""
-    try:
-        user_boards = get_user_boards(user.id, db)
+    user_boards = get_chatbot_boards(user, db)
 
-        if not user_boards:
-            return {
-                "status": "error",
-                "message": "You don't have any boards yet! You need to create a board and list first.",
-                "suggestion": "Try saying 'Create a new board called [Board Name]' first!",
-            }
-
-        # Prioritize current board for finding lists
-        target_lists = []
-        current_board = None
-
-        # If user is viewing a board, prioritize lists from that board
-        if current_board_context and current_board_context.board_id:
-            for board in user_boards:
-                if board.id == current_board_context.board_id:
-                    current_board = board
-                    for lst in board.lists:
-                        target_lists.append(
-                            {"list": lst, "board": board, "is_current_board": True}
-                        )
-                    break
-
-        # Add lists from other boards
-        for board in user_boards:
-            if not current_board or board.id != current_board.id:
-                for lst in board.lists:
-                    target_lists.append(
-                        {"list": lst, "board": board, "is_current_board": False}
-                    )
-
-        if not target_lists:
-            current_board_hint = ""
-            if current_board_context and current_board_context.board_title:
-                current_board_hint = (
-                    f" in your '{current_board_context.board_title}' board"
-                )
-
-            return {
-                "status": "error",
-                "message": f"You don't have any lists yet{current_board_hint}! You need to create a list first before adding tasks.",
-                "suggestion": "Try saying 'Create a new list called To Do' first!",
-            }
+    if not user_boards:
+        return {
+            "status": "error",
+            "message": "You don't have any boards yet! You need to create a board and list first.",
+            "suggestion": "Try saying 'Create a new board called [Board Name]' first!",
+        }
 
-        # Find target list with smart matching
-        target_list_info = None
-
-        if list_name:
-            # First try exact match in current board
-            if current_board:
-                for list_info in target_lists:
-                    if (
-                        list_info["is_current_board"]
-                        and list_info["list"].title.lower() == list_name.lower()
-                    ):
-                        target_list_info = list_info
-                        break
-
-            # If not found in current board, try exact match in all boards
-            if not target_list_info:
-                for list_info in target_lists:
-                    if list_info["list"].title.lower() == list_name.lower():
-                        target_list_info = list_info
-                        break
-
-            # If still not found, try fuzzy matching
-            if not target_list_info:
-                import difflib
-
-                # Prioritize current board lists for fuzzy matching
-                current_board_lists = [
-                    info["list"].title
-                    for info in target_lists
-                    if info["is_current_board"]
-                ]
-                all_lists = [info["list"].title for info in target_lists]
-
-                # Try fuzzy match in current board first
-                close_matches = []
-                if current_board_lists:
-                    close_matches = difflib.get_close_matches(
-                        list_name, current_board_lists, n=1, cutoff=0.6
-                    )
-
-                # If no good match in current board, try all lists
-                if not close_matches:
-                    close_matches = difflib.get_close_matches(
-                        list_name, all_lists, n=1, cutoff=0.6
-                    )
-
-                if close_matches:
-                    # Found a close match
-                    for list_info in target_lists:
-                        if list_info["list"].title == close_matches[0]:
-                            target_list_info = list_info
-                            break
-
-                    board_hint = ""
-                    if target_list_info["is_current_board"]:
-                        board_hint = " (in your current board)"
-                    else:
-                        board_hint = f" (in '{target_list_info['board'].title}')"
-
-                    return {
-                        "status": "clarification",
-                        "message": f"I couldn't find a list called '{list_name}', but I found '{close_matches[0]}'{board_hint} which seems similar. Should I add the task there?",
-                        "suggested_list": close_matches[0],
-                        "suggested_board": target_list_info["board"].title,
-                        "action": "clarify_list",
-                    }
-                else:
-                    # No close match found
-                    current_board_lists_str = ""
-                    if current_board and current_board_context:
-                        current_lists = [
-                            info["list"].title
-                            for info in target_lists
-                            if info["is_current_board"]
-                        ]
-                        if current_lists:
-                            current_board_lists_str = f" In your current board '{current_board_context.board_title}', you have: {', '.join(current_lists)}."
-
-                    all_available_lists = [
-                        f"'{info['list'].title}' (in {info['board'].title})"
-                        for info in target_lists[
-                            :5
-                        ]  # Show first 5 to avoid overwhelming
-                    ]
-
-                    return {
-                        "status": "error",
-                        "message": f"I couldn't find a list called '{list_name}' 🤔{current_board_lists_str}",
-                        "available_lists": all_available_lists,
-                        "suggestion": f"Available lists: {', '.join(all_available_lists[:3])}{'...' if len(all_available_lists) > 3 else ''}",
-                    }
-        else:
-            # No list specified - ask for clarification with current board prioritized
-            if (
-                current_board
-                and len([info for info in target_lists if info["is_current_board"]]) > 0
-            ):
-                current_board_lists = [
-                    f"'{info['list'].title}'"
-                    for info in target_lists
-                    if info["is_current_board"]
-                ]
+    current_board = find_current_board(user_boards, current_board_context)
 
-                return {
-                    "status": "clarification_needed",
-                    "message": f"I'd be happy to create the task '{card_title}' for you! 📝 Which list in your '{current_board_context.board_title}' board should I add it to?",
-                    "available_lists": current_board_lists,
-                    "current_board": current_board_context.board_title,
-                    "suggestion": f"You have these lists in your current board: {', '.join(current_board_lists)}. Just let me know which one!",
-                }
-            else:
-                # Multiple boards and lists
-                all_available_lists = [
-                    f"'{info['list'].title}' (in {info['board'].title})"
-                    for info in target_lists[:5]
-                ]
+    # Find target list with smart matching
+    if not list_name:
+        return ask_for_target_list(
+            user_boards,
+            current_board,
+            current_board_context,
+            f"create the task '{card_title}'",
+            "add it to",
+        )
 
-                return {
-                    "status": "clarification_needed",
-                    "message": f"I'd be happy to create the task '{card_title}' for you! 📝 Which list would you like me to add it to?",
-                    "available_lists": all_available_lists,
-                    "suggestion": f"You have these lists: {', '.join(all_available_lists[:3])}{'...' if len(all_available_lists) > 3 else ''}. Just let me know which one!",
-                }
+    target_lists = list(iter_target_lists(user_boards, current_board))
+    if not target_lists:
+        return no_lists_reply(current_board_context)
 
-        target_list = target_list_info["list"]
-        target_board = target_list_info["board"]
+    target_list_info, reply = resolve_target_list(
+        list_name,
+        target_lists,
+        current_board,
+        current_board_context,
+        "add the task there",
+    )
+    if reply:
+        return reply
 
-        max_position = len(target_list.cards)
+    target_list = target_list_info.lst
+    target_board = target_list_info.board
 
-        from models import Priority
+    max_position = count_list_cards(target_list.id, db)
 
-        priority_enum = Priority.MEDIUM
-        if priority:
-            try:
-                priority_enum = Priority(priority.lower())
-            except ValueError:
-                priority_enum = Priority.MEDIUM
+    priority_value = priority.lower() if priority else None
+    if priority_value not in PRIORITY_VALUES:
+        priority_value = Priority.MEDIUM.value
 
-        new_card = CardModel(
-            title=card_title,
-            description=card_description,
-            list_id=target_list.id,
-            position=max_position,
-            created_by=user.id,
-            checklist=[],
-            priority=priority_enum,
-        )
+    new_card = CardModel(
+        title=card_title,
+        description=card_description,
+        list_id=target_list.id,
+        position=max_position,
+        created_by=user.id,
+        checklist=[],
+        priority=priority_value,
+    )
 
+    try:
         db.add(new_card)
-        db.commit()
-        db.refresh(new_card)
+        db.flush()  # Assigns new_card.id without ending the transaction
 
         # Add creator as contributor
         contributor = CardContributorModel(card_id=new_card.id, user_id=user.id)
         db.add(contributor)
+        bump_board_versions(db, target_board.id)
         db.commit()
+    except SQLAlchemyError as e:
+        return chatbot_write_failed(db, e)
 
-        priority_display = priority.title() if priority else "Medium"
+    priority_display = priority.title() if priority else "Medium"
 
-        # Add context note
-        context_note = ""
-        if target_list_info["is_current_board"]:
-            context_note = " (in your current board)"
+    # Add context note
+    context_note = ""
+    if target_list_info.is_current:
+        context_note = " (in your current board)"
 
-        return {
-            "status": "success",
-            "message": f"Excellent! ✅ I've created the task '{card_title}' in your '{target_list.title}' list on the '{target_board.title}' board{context_note}. Priority is set to {priority_display}.",
+    return {
+        "status": "success",
+        "message": f"Excellent! ✅ I've created the task '{card_title}' in your '{target_list.title}' list on the '{target_board.title}' board{context_note}. Priority is set to {priority_display}.",
+        "card_id": new_card.id,
+        "card_title": card_title,
+        "list_name": target_list.title,
+        "board_name": target_board.title,
+        "board_id": target_board.id,
+        "priority": priority_display,
+        "action": "card_created",
+        "data": {
             "card_id": new_card.id,
             "card_title": card_title,
             "list_name": target_list.title,
             "board_name": target_board.title,
             "board_id": target_board.id,
-            "priority": priority_display,
-            "action": "card_created",
-            "data": {
-                "card_id": new_card.id,
-                "card_title": card_title,
-                "list_name": target_list.title,
-                "board_name": target_board.title,
-                "board_id": target_board.id,
-            },
-        }
-    except Exception as e:
-        return {"status": "error", "message": str(e)}
+        },
+    }
+
+
+def iter_board_cards(lists):
+    """Yield ``(card, list)`` for the lists' loaded cards in board order"""
+    for lst in sorted(lists, key=lambda lst: lst.position):
+        for card in sorted(lst.cards, key=lambda card: card.position):
+            yield card, lst
+
+
+def find_card_in_lists(lists, card_title: str):
+    """Find the first card whose title contains card_title, ignoring case
+
+    Searches the lists' already-loaded cards in board order. Returns
+    ``(card, list)``, or ``(None, None)`` if no card matches.
+    """
+    needle = card_title.lower()
+    return next(
+        (
+            (card, lst)
+            for card, lst in iter_board_cards(lists)
+            if needle in lower_title(card)
+        ),
+        (None, None),
+    )
+
+
+def board_card_titles(lists, limit: int = 10):
+    """(card title, list title) pairs for the first cards, used in suggestions"""
+    return [
+        (card.title, lst.title) for card, lst in islice(iter_board_cards(lists), limit)
+    ]
 
 
 async def move_card_function(
@@ -2187,298 +2891,104 @@ async def move_card_function(
     db: Session,
 ) -> dict:
     """Move a card for OpenAI function calling with current board context awareness"""
-    try:
-        user_boards = get_user_boards(user.id, db)
-
-        if not user_boards:
-            return {
-                "status": "error",
-                "message": "You don't have any boards yet! You need to create a board and list first.",
-                "suggestion": "Try saying 'Create a new board called [Board Name]' first!",
-            }
+    user_boards = get_chatbot_boards(user, db)
 
-        # Prioritize current board for finding lists
-        target_lists = []
-        current_board = None
-
-        # If user is viewing a board, prioritize lists from that board
-        if current_board_context and current_board_context.board_id:
-            for board in user_boards:
-                if board.id == current_board_context.board_id:
-                    current_board = board
-                    for lst in board.lists:
-                        target_lists.append(
-                            {"list": lst, "board": board, "is_current_board": True}
-                        )
-                    break
-
-        # Add lists from other boards
-        for board in user_boards:
-            if not current_board or board.id != current_board.id:
-                for lst in board.lists:
-                    target_lists.append(
-                        {"list": lst, "board": board, "is_current_board": False}
-                    )
-
-        if not target_lists:
-            current_board_hint = ""
-            if current_board_context and current_board_context.board_title:
-                current_board_hint = (
-                    f" in your '{current_board_context.board_title}' board"
-                )
+    if not user_boards:
+        return {
+            "status": "error",
+            "message": "You don't have any boards yet! You need to create a board and list first.",
+            "suggestion": "Try saying 'Create a new board called [Board Name]' first!",
+        }
 
-            return {
-                "status": "error",
-                "message": f"You don't have any lists yet{current_board_hint}! You need to create a list first before adding tasks.",
-                "suggestion": "Try saying 'Create a new list called To Do' first!",
-            }
+    current_board = find_current_board(user_boards, current_board_context)
 
-        # Find target list with smart matching
-        target_list_info = None
-
-        if target_list_name:
-            # First try exact match in current board
-            if current_board:
-                for list_info in target_lists:
-                    if (
-                        list_info["is_current_board"]
-                        and list_info["list"].title.lower() == target_list_name.lower()
-                    ):
-                        target_list_info = list_info
-                        break
-
-            # If not found in current board, try exact match in all boards
-            if not target_list_info:
-                for list_info in target_lists:
-                    if list_info["list"].title.lower() == target_list_name.lower():
-                        target_list_info = list_info
-                        break
-
-            # If still not found, try fuzzy matching
-            if not target_list_info:
-                import difflib
-
-                # Prioritize current board lists for fuzzy matching
-                current_board_lists = [
-                    info["list"].title
-                    for info in target_lists
-                    if info["is_current_board"]
-                ]
-                all_lists = [info["list"].title for info in target_lists]
-
-                # Try fuzzy match in current board first
-                close_matches = []
-                if current_board_lists:
-                    close_matches = difflib.get_close_matches(
-                        target_list_name, current_board_lists, n=1, cutoff=0.6
-                    )
-
-                # If no good match in current board, try all lists
-                if not close_matches:
-                    close_matches = difflib.get_close_matches(
-                        target_list_name, all_lists, n=1, cutoff=0.6
-                    )
-
-                if close_matches:
-                    # Found a close match
-                    for list_info in target_lists:
-                        if list_info["list"].title == close_matches[0]:
-                            target_list_info = list_info
-                            break
-
-                    board_hint = ""
-                    if target_list_info["is_current_board"]:
-                        board_hint = " (in your current board)"
-                    else:
-                        board_hint = f" (in '{target_list_info['board'].title}')"
-
-                    return {
-                        "status": "clarification",
-                        "message": f"I couldn't find a list called '{target_list_name}', but I found '{close_matches[0]}'{board_hint} which seems similar. Should I move the card there?",
-                        "suggested_list": close_matches[0],
-                        "suggested_board": target_list_info["board"].title,
-                        "action": "clarify_list",
-                    }
-                else:
-                    # No close match found
-                    current_board_lists_str = ""
-                    if current_board and current_board_context:
-                        current_lists = [
-                            info["list"].title
-                            for info in target_lists
-                            if info["is_current_board"]
-                        ]
-                        if current_lists:
-                            current_board_lists_str = f" In your current board '{current_board_context.board_title}', you have: {', '.join(current_lists)}."
-
-                    all_available_lists = [
-                        f"'{info['list'].title}' (in {info['board'].title})"
-                        for info in target_lists[
-                            :5
-                        ]  # Show first 5 to avoid overwhelming
-                    ]
-
-                    return {
-                        "status": "error",
-                        "message": f"I couldn't find a list called '{target_list_name}' 🤔{current_board_lists_str}",
-                        "available_lists": all_available_lists,
-                        "suggestion": f"Available lists: {', '.join(all_available_lists[:3])}{'...' if len(all_available_lists) > 3 else ''}",
-                    }
-        else:
-            # No list specified - ask for clarification with current board prioritized
-            if (
-                current_board
-                and len([info for info in target_lists if info["is_current_board"]]) > 0
-            ):
-                current_board_lists = [
-                    f"'{info['list'].title}'"
-                    for info in target_lists
-                    if info["is_current_board"]
-                ]
+    # Find target list with smart matching
+    if not target_list_name:
+        return ask_for_target_list(
+            user_boards,
+            current_board,
+            current_board_context,
+            f"move the card '{card_title}'",
+            "move it to",
+        )
 
-                return {
-                    "status": "clarification_needed",
-                    "message": f"I'd be happy to move the card '{card_title}' for you! 📝 Which list in your '{current_board_context.board_title}' board should I move it to?",
-                    "available_lists": current_board_lists,
-                    "current_board": current_board_context.board_title,
-                    "suggestion": f"You have these lists in your current board: {', '.join(current_board_lists)}. Just let me know which one!",
-                }
-            else:
-                # Multiple boards and lists
-                all_available_lists = [
-                    f"'{info['list'].title}' (in {info['board'].title})"
-                    for info in target_lists[:5]
-                ]
+    target_lists = list(iter_target_lists(user_boards, current_board))
+    if not target_lists:
+        return no_lists_reply(current_board_context)
 
-                return {
-                    "status": "clarification_needed",
-                    "message": f"I'd be happy to move the card '{card_title}' for you! 📝 Which list would you like me to move it to?",
-                    "available_lists": all_available_lists,
-                    "suggestion": f"You have these lists: {', '.join(all_available_lists[:3])}{'...' if len(all_available_lists) > 3 else ''}. Just let me know which one!",
-                }
+    target_list_info, reply = resolve_target_list(
+        target_list_name,
+        target_lists,
+        current_board,
+        current_board_context,
+        "move the card there",
+    )
+    if reply:
+        return reply
 
-        target_list = target_list_info["list"]
-        target_board = target_list_info["board"]
+    target_list = target_list_info.lst
+    target_board = target_list_info.board
 
-        # Find the card to move (search in current board, not target list)
-        current_board_id = target_board.id
-        card_to_move = None
+    # Find the card to move (search in current board, not target list); the
+    # board's cards are already loaded by get_chatbot_boards
+    card_to_move, _ = find_card_in_lists(target_board.lists, card_title)
 
-        # Search all lists in the current board for the card
-        all_lists_in_board = (
-            db.query(TaskListModel)
-            .filter(TaskListModel.board_id == current_board_id)
-            .all()
-        )
-        for lst in all_lists_in_board:
-            card = (
-                db.query(CardModel)
-                .filter(CardModel.list_id == lst.id)
-                .filter(CardModel.title.ilike(f"%{card_title}%"))
-                .first()
-            )
-            if card:
-                card_to_move = card
-                break
-
-        if not card_to_move:
-            # Get all cards in the board for suggestions
-            all_cards_in_board = []
-            for lst in all_lists_in_board:
-                cards_in_list = (
-                    db.query(CardModel).filter(CardModel.list_id == lst.id).all()
-                )
-                for card in cards_in_list:
-                    all_cards_in_board.append(f"'{card.title}' (in {lst.title})")
+    if not card_to_move:
+        # Get cards in the board for suggestions
+        card_titles = board_card_titles(target_board.lists)
+        all_cards_in_board = [
+            f"'{title}' (in {list_title})" for title, list_title in card_titles
+        ]
+        card_names = [f"'{title}'" for title, _ in card_titles]
 
-            return {
-                "status": "error",
-                "message": f"I couldn't find a card with the title '{card_title}' in the '{target_board.title}' board.",
-                "available_cards": all_cards_in_board[:10],  # Show first 10 cards
-                "suggestion": f"Available cards: {', '.join([c.split(' (in ')[0] for c in all_cards_in_board[:3]])}{'...' if len(all_cards_in_board) > 3 else ''}",
-            }
+        return {
+            "status": "error",
+            "message": f"I couldn't find a card with the title '{card_title}' in the '{target_board.title}' board.",
+            "available_cards": all_cards_in_board,
+            "suggestion": f"Available cards: {preview_list(card_names)}",
+        }
 
-        old_list_id = card_to_move.list_id
-        old_position = card_to_move.position
+    old_list_id = card_to_move.list_id
+    old_position = card_to_move.position
 
-        # Calculate new position
-        if position == -1:
-            new_position = len(target_list.cards)  # Bottom of target list
-        else:
-            new_position = min(
-                position, len(target_list.cards)
-            )  # Ensure position is valid
-
-        # Update positions of other cards
-        if old_list_id != target_list.id:
-            # Moving between different lists
-            # Move cards up in the old list
-            db.query(CardModel).filter(
-                CardModel.list_id == old_list_id, CardModel.position > old_position
-            ).update({"position": CardModel.position - 1})
-
-            # Move cards down in the new list to make room
-            db.query(CardModel).filter(
-                CardModel.list_id == target_list.id,
-                CardModel.position >= new_position,
-            ).update({"position": CardModel.position + 1})
-        else:
-            # Moving within the same list
-            if new_position > old_position:
-                # Moving down in the list
-                db.query(CardModel).filter(
-                    CardModel.list_id == old_list_id,
-                    CardModel.position > old_position,
-                    CardModel.position <= new_position,
-                ).update({"position": CardModel.position - 1})
-            elif new_position < old_position:
-                # Moving up in the list
-                db.query(CardModel).filter(
-                    CardModel.list_id == old_list_id,
-                    CardModel.position >= new_position,
-                    CardModel.position < old_position,
-                ).update({"position": CardModel.position + 1})
-
-        # Update the card
-        card_to_move.list_id = target_list.id
-        card_to_move.position = new_position
+    # Calculate new position
+    target_list_size = count_list_cards(target_list.id, db)
+    if position == -1:
+        new_position = target_list_size  # Bottom of target list
+    else:
+        new_position = min(position, target_list_size)  # Ensure position is valid
 
-        # Add user as contributor for moving the card
-        existing_contributor = (
-            db.query(CardContributorModel)
-            .filter(
-                CardContributorModel.card_id == card_to_move.id,
-                CardContributorModel.user_id == user.id,
-            )
-            .first()
+    try:
+        # Move the card and update positions of other cards
+        reposition_card(
+            db, card_to_move.id, old_list_id, old_position, target_list.id, new_position
         )
 
-        if not existing_contributor:
-            contributor = CardContributorModel(card_id=card_to_move.id, user_id=user.id)
-            db.add(contributor)
+        # Add user as contributor for moving the card
+        add_card_contributor(db, card_to_move.id, user.id)
+        bump_board_versions(db, target_board.id)
 
         db.commit()
-        db.refresh(card_to_move)
+    except SQLAlchemyError as e:
+        return chatbot_write_failed(db, e)
 
-        return {
-            "status": "success",
-            "message": f"Perfect! ✅ I've moved the card '{card_to_move.title}' to the '{target_list.title}' list on the '{target_board.title}' board.",
+    return {
+        "status": "success",
+        "message": f"Perfect! ✅ I've moved the card '{card_to_move.title}' to the '{target_list.title}' list on the '{target_board.title}' board.",
+        "card_id": card_to_move.id,
+        "card_title": card_to_move.title,
+        "list_name": target_list.title,
+        "board_name": target_board.title,
+        "board_id": target_board.id,
+        "action": "card_moved",
+        "data": {
             "card_id": card_to_move.id,
             "card_title": card_to_move.title,
             "list_name": target_list.title,
             "board_name": target_board.title,
             "board_id": target_board.id,
-            "action": "card_moved",
-            "data": {
-                "card_id": card_to_move.id,
-                "card_title": card_to_move.title,
-                "list_name": target_list.title,
-                "board_name": target_board.title,
-                "board_id": target_board.id,
-            },
-        }
-    except Exception as e:
-        return {"status": "error", "message": str(e)}
+        },
+    }
 
 
 async def delete_card_function(
@@ -2489,169 +2999,156 @@ async def delete_card_function(
     db: Session,
 ) -> dict:
     """Delete a card for OpenAI function calling with current board context awareness"""
-    try:
-        user_boards = get_user_boards(user.id, db)
+    user_boards = get_chatbot_boards(user, db)
+
+    if not user_boards:
+        return {
+            "status": "error",
+            "message": "You don't have any boards yet! You need to create a board and list first.",
+            "suggestion": "Try saying 'Create a new board called [Board Name]' first!",
+        }
+
+    # Prioritize current board; if there isn't one, use the first board
+    current_board = (
+        find_current_board(user_boards, current_board_context) or user_boards[0]
+    )
+
+    # If list_name is not specified, search all lists in current board
+    if not list_name:
+        # Search all lists in the current board (cards are already loaded)
+        card_to_delete, source_list = find_card_in_lists(
+            current_board.lists, card_title
+        )
+
+        if not card_to_delete:
+            # Get cards in the board for suggestions
+            card_titles = board_card_titles(current_board.lists)
+            all_cards_in_board = [
+                f"'{title}' (in {list_title})" for title, list_title in card_titles
+            ]
+            card_names = [f"'{title}'" for title, _ in card_titles]
 
-        if not user_boards:
             return {
                 "status": "error",
-                "message": "You don't have any boards yet! You need to create a board and list first.",
-                "suggestion": "Try saying 'Create a new board called [Board Name]' first!",
+                "message": f"I couldn't find a card with the title '{card_title}' in the '{current_board.title}' board.",
+                "available_cards": all_cards_in_board,
+                "suggestion": f"Available cards: {preview_list(card_names)}",
             }
+    else:
+        # Find specific list first
+        target_list = index_by_lower_title(current_board.lists).get(list_name.lower())
 
-        # Prioritize current board
-        current_board = None
-        if current_board_context and current_board_context.board_id:
-            for board in user_boards:
-                if board.id == current_board_context.board_id:
-                    current_board = board
-                    break
-
-        # If no current board, use first board
-        if not current_board:
-            current_board = user_boards[0]
-
-        # If list_name is not specified, search all lists in current board
-        if not list_name:
-            # Search all lists in the current board for the card
-            all_lists_in_board = (
-                db.query(TaskListModel)
-                .filter(TaskListModel.board_id == current_board.id)
-                .all()
+        if not target_list:
+            # Try fuzzy matching
+            list_titles = [lst.title for lst in current_board.lists]
+            close_match = find_close_match(
+                list_name,
+                list_titles,
+                [lower_title(lst) for lst in current_board.lists],
             )
-            card_to_delete = None
-            source_list = None
-
-            for lst in all_lists_in_board:
-                card = (
-                    db.query(CardModel)
-                    .filter(CardModel.list_id == lst.id)
-                    .filter(CardModel.title.ilike(f"%{card_title}%"))
-                    .first()
-                )
-                if card:
-                    card_to_delete = card
-                    source_list = lst
-                    break
-
-            if not card_to_delete:
-                # Get all cards in the board for suggestions
-                all_cards_in_board = []
-                for lst in all_lists_in_board:
-                    cards_in_list = (
-                        db.query(CardModel).filter(CardModel.list_id == lst.id).all()
-                    )
-                    for card in cards_in_list:
-                        all_cards_in_board.append(f"'{card.title}' (in {lst.title})")
 
+            if close_match:
                 return {
-                    "status": "error",
-                    "message": f"I couldn't find a card with the title '{card_title}' in the '{current_board.title}' board.",
-                    "available_cards": all_cards_in_board[:10],  # Show first 10 cards
-                    "suggestion": f"Available cards: {', '.join([c.split(' (in ')[0] for c in all_cards_in_board[:3]])}{'...' if len(all_cards_in_board) > 3 else ''}",
+                    "status": "clarification",
+                    "message": f"I couldn't find a list called '{list_name}', but I found '{close_match}' which seems similar. Should I delete the card from there?",
+                    "suggested_list": close_match,
+                    "suggested_board": current_board.title,
+                    "action": "clarify_list",
                 }
-        else:
-            # Find specific list first
-            target_list = None
-            for lst in current_board.lists:
-                if lst.title.lower() == list_name.lower():
-                    target_list = lst
-                    break
-
-            if not target_list:
-                # Try fuzzy matching
-                import difflib
-
-                list_titles = [lst.title for lst in current_board.lists]
-                close_matches = difflib.get_close_matches(
-                    list_name, list_titles, n=1, cutoff=0.6
-                )
-
-                if close_matches:
-                    return {
-                        "status": "clarification",
-                        "message": f"I couldn't find a list called '{list_name}', but I found '{close_matches[0]}' which seems similar. Should I delete the card from there?",
-                        "suggested_list": close_matches[0],
-                        "suggested_board": current_board.title,
-                        "action": "clarify_list",
-                    }
-                else:
-                    available_lists = [lst.title for lst in current_board.lists]
-                    return {
-                        "status": "error",
-                        "message": f"I couldn't find a list called '{list_name}' in your '{current_board.title}' board.",
-                        "available_lists": available_lists,
-                        "suggestion": f"Available lists: {', '.join(available_lists[:3])}{'...' if len(available_lists) > 3 else ''}",
-                    }
-
-            # Search for card in the specific list
-            card_to_delete = (
-                db.query(CardModel)
-                .filter(CardModel.list_id == target_list.id)
-                .filter(CardModel.title.ilike(f"%{card_title}%"))
-                .first()
-            )
-            source_list = target_list
-
-            if not card_to_delete:
-                # Show cards from specified list
-                all_cards = [f"'{c.title}'" for c in target_list.cards]
+            else:
                 return {
                     "status": "error",
-                    "message": f"I couldn't find a card with the title '{card_title}' in the '{target_list.title}' list.",
-                    "available_cards": all_cards[:10],  # Show first 10 cards
-                    "suggestion": f"Available cards: {', '.join(all_cards[:3])}{'...' if len(all_cards) > 3 else ''}",
+                    "message": f"I couldn't find a list called '{list_name}' in your '{current_board.title}' board.",
+                    "available_lists": list_titles,
+                    "suggestion": f"Available lists: {preview_list(list_titles)}",
                 }
 
-        # Update positions of cards after the deleted card
-        old_position = card_to_delete.position
-        db.query(CardModel).filter(
-            CardModel.list_id == source_list.id, CardModel.position > old_position
-        ).update({"position": CardModel.position - 1})
+        # Search for card in the specific list
+        card_to_delete, _ = find_card_in_lists([target_list], card_title)
+        source_list = target_list
 
-        # Add user as contributor for deleting the card (before deletion)
-        existing_contributor = (
-            db.query(CardContributorModel)
-            .filter(
-                CardContributorModel.card_id == card_to_delete.id,
-                CardContributorModel.user_id == user.id,
-            )
-            .first()
-        )
-
-        if not existing_contributor:
-            contributor = CardContributorModel(
-                card_id=card_to_delete.id, user_id=user.id
-            )
-            db.add(contributor)
+        if not card_to_delete:
+            # Show cards from specified list
+            all_cards = [f"'{c.title}'" for c in target_list.cards]
+            return {
+                "status": "error",
+                "message": f"I couldn't find a card with the title '{card_title}' in the '{target_list.title}' list.",
+                "available_cards": all_cards[:10],  # Show first 10 cards
+                "suggestion": f"Available cards: {preview_list(all_cards)}",
+            }
 
-        # Store card info before deletion
-        deleted_card_id = card_to_delete.id
-        deleted_card_title = card_to_delete.title
+    # Store card info before deletion
+    deleted_card_id = card_to_delete.id
+    deleted_card_title = card_to_delete.title
 
-        # Delete the card
-        db.delete(card_to_delete)
+    try:
+        # Delete the card and update positions of cards after it
+        delete_card_and_close_gap(db, card_to_delete)
+        bump_board_versions(db, current_board.id)
         db.commit()
+    except SQLAlchemyError as e:
+        return chatbot_write_failed(db, e)
 
-        return {
-            "status": "success",
-            "message": f"Perfect! ✅ I've deleted the card '{deleted_card_title}' from the '{source_list.title}' list on the '{current_board.title}' board.",
+    return {
+        "status": "success",
+        "message": f"Perfect! ✅ I've deleted the card '{deleted_card_title}' from the '{source_list.title}' list on the '{current_board.title}' board.",
+        "card_id": deleted_card_id,
+        "card_title": deleted_card_title,
+        "list_name": source_list.title,
+        "board_name": current_board.title,
+        "board_id": current_board.id,
+        "action": "card_deleted",
+        "data": {
             "card_id": deleted_card_id,
             "card_title": deleted_card_title,
             "list_name": source_list.title,
             "board_name": current_board.title,
             "board_id": current_board.id,
-            "action": "card_deleted",
-            "data": {
-                "card_id": deleted_card_id,
-                "card_title": deleted_card_title,
-                "list_name": source_list.title,
-                "board_name": current_board.title,
-                "board_id": current_board.id,
-            },
-        }
-    except Exception as e:
-        return {"status": "error", "message": str(e)}
+        },
+    }
+
+
+def find_board_by_title(user_id: int, title: str, db: Session):
+    """The user's board with this title, ignoring case, or None
+
+    Matches on ``lower(title)``, which ``ix_boards_lower_title`` indexes.
+    Owned boards win over shared ones with the same title.
+    """
+    return (
+        db.query(BoardModel)
+        .filter(
+            board_access_clause(user_id),
+            func.lower(BoardModel.title) == title.lower(),
+        )
+        .order_by(case((BoardModel.owner_id == user_id, 0), else_=1), BoardModel.id)
+        .first()
+    )
+
+
+def get_board_snapshot(board_id: int, db: Session) -> dict:
+    """Summarise a board's lists and member count for the chatbot.
+
+    Card counts come from one aggregate query rather than loading every
+    list and card through the ORM.
+    """
+    list_rows = (
+        db.query(TaskListModel.title, func.count(CardModel.id))
+        .outerjoin(CardModel, CardModel.list_id == TaskListModel.id)
+        .filter(TaskListModel.board_id == board_id)
+        .group_by(TaskListModel.id)
+        .order_by(TaskListModel.position, TaskListModel.id)
+        .all()
+    )
+    member_count = (
+        db.query(func.count(BoardMemberModel.id))
+        .filter(BoardMemberModel.board_id == board_id)
+        .scalar()
+    )
+
+    return {
+        "lists": [{"name": title, "cards": count} for title, count in list_rows],
+        "member_count": member_count,
+    }
 
 
 async def get_board_info_function(
@@ -2659,31 +3156,31 @@ async def get_board_info_function(
 ) -> dict:
     """Get board information for OpenAI function calling"""
     try:
-        user_boards = get_user_boards(user.id, db)
-
-        if not user_boards:
-            return {"status": "error", "message": "No boards found"}
-
-        # Find target board
-        target_board = user_boards[0]  # Default to first board
+        # Find target board by name with one indexed query
+        target_board = None
         if board_name:
-            for board in user_boards:
-                if board.title.lower() == board_name.lower():
-                    target_board = board
-                    break
+            target_board = find_board_by_title(user.id, board_name, db)
+
+        if not target_board:
+            # Reuse the boards an earlier step of this request already loaded
+            user_boards = db.info.get("chatbot_boards", {}).get(user.id)
+            if user_boards is None:
+                user_boards = get_user_boards(user.id, db)
+            if not user_boards:
+                return {"status": "error", "message": "No boards found"}
+            target_board = user_boards[0]  # Default to first board
 
-        lists_info = []
-        for lst in target_board.lists:
-            lists_info.append({"name": lst.title, "cards": len(lst.cards)})
+        snapshot = get_board_snapshot(target_board.id, db)
+        lists_info = snapshot["lists"]
 
         board_data = {
             "id": target_board.id,
             "title": target_board.title,
             "description": target_board.description,
-            "type": "Shared" if target_board.is_shared else "Personal",
-            "lists": len(target_board.lists),
-            "total_cards": sum(len(lst.cards) for lst in target_board.lists),
-            "members": len(target_board.members) + 1 if target_board.is_shared else 1,
+            "type": "Shared" if snapshot["member_count"] > 0 else "Personal",
+            "lists": len(lists_info),
+            "total_cards": sum(lst["cards"] for lst in lists_info),
+            "members": snapshot["member_count"] + 1,
             "created": target_board.created_at.strftime("%B %d, %Y"),
             "lists_info": lists_info,
         }
@@ -2702,9 +3199,29 @@ async def get_board_info_function(
 async def get_available_options_function(user: UserModel, db: Session) -> dict:
     """Get available boards and lists to help with decision making"""
     try:
-        user_boards = get_user_boards(user.id, db)
+        # One row per (board, list) with the list's card count; boards
+        # without lists come back once with a NULL list
+        rows = (
+            db.query(
+                BoardModel.id,
+                BoardModel.title,
+                BoardModel.description,
+                TaskListModel.title,
+                func.count(CardModel.id),
+            )
+            .outerjoin(TaskListModel, TaskListModel.board_id == BoardModel.id)
+            .outerjoin(CardModel, CardModel.list_id == TaskListModel.id)
+            .filter(board_access_clause(user.id))
+            .group_by(BoardModel.id, TaskListModel.id)
+            .order_by(
+                case((BoardModel.owner_id == user.id, 0), else_=1),
+                BoardModel.id,
+                TaskListModel.position,
+            )
+            .all()
+        )
 
-        if not user_boards:
+        if not rows:
             return {
                 "status": "success",
                 "message": "No boards found. You'll need to create your first board!",
@@ -2713,26 +3230,28 @@ async def get_available_options_function(user: UserModel, db: Session) -> dict:
                 "action": "show_options",
             }
 
-        boards_info = []
-        for board in user_boards:
-            lists_info = []
-            for lst in board.lists:
-                lists_info.append({"name": lst.title, "card_count": len(lst.cards)})
-
-            boards_info.append(
-                {
-                    "name": board.title,
-                    "description": board.description,
-                    "lists": lists_info,
-                    "total_cards": sum(len(lst.cards) for lst in board.lists),
+        boards_by_id = {}
+        for board_id, title, description, list_title, card_count in rows:
+            board_info = boards_by_id.get(board_id)
+            if board_info is None:
+                board_info = boards_by_id[board_id] = {
+                    "name": title,
+                    "description": description,
+                    "lists": [],
+                    "total_cards": 0,
                 }
-            )
+            if list_title is not None:
+                board_info["lists"].append(
+                    {"name": list_title, "card_count": card_count}
+                )
+                board_info["total_cards"] += card_count
+        boards_info = list(boards_by_id.values())
 
         return {
             "status": "success",
             "message": f"Here are your available options:",
             "boards": boards_info,
-            "total_boards": len(user_boards),
+            "total_boards": len(boards_info),
             "action": "show_options",
             "data": {"boards": boards_info},
         }
@@ -2740,6 +3259,10 @@ async def get_available_options_function(user: UserModel, db: Session) -> dict:
         return {"status": "error", "message": str(e)}
 
 
+# Whisper rejects uploads over 25 MB, so don't forward anything larger
+MAX_AUDIO_UPLOAD_BYTES = 25 * 1024 * 1024
+
+
 @app.post("/api/chatbot/voice-to-text")
 async def voice_to_text(
     audio: UploadFile = File(...),
@@ -2756,18 +3279,22 @@ async def voice_to_text(
             status_code=400, detail="Invalid file type. Please upload an audio file."
         )
 
-    try:
-        # Read audio data
-        audio_data = await audio.read()
-
-        # Create a temporary file-like object for OpenAI
-        import io
+    if audio.size is not None and audio.size > MAX_AUDIO_UPLOAD_BYTES:
+        raise HTTPException(
+            status_code=413, detail="Audio file is too large. The limit is 25 MB."
+        )
 
-        audio_file = io.BytesIO(audio_data)
-        audio_file.name = audio.filename or "audio.wav"
+    try:
+        # Hand Whisper the upload's spooled file instead of copying it into
+        # memory first
+        audio_file = (
+            audio.filename or "audio.wav",
+            audio.file,
+            audio.content_type,
+        )
 
         # Transcribe using Whisper
-        transcript = openai_client.audio.transcriptions.create(
+        transcript = await openai_client.audio.transcriptions.create(
             model="whisper-1", file=audio_file, response_format="text"
         )
 
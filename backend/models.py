@@ -7,15 +7,15 @@ from sqlalchemy import (
     JSON,
     DateTime,
     Boolean,
-    Enum,
+    Index,
+    func,
 )
-from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from typing import List as ListType
 import enum
 
-Base = declarative_base()
+from database import Base
 
 
 class InvitationStatus(enum.Enum):
@@ -44,7 +44,7 @@ class User(Base):
     full_name = Column(String(100), nullable=True)
     avatar_url = Column(String(255), nullable=True)
     hashed_password = Column(String(255), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
     is_active = Column(Boolean, default=True)
 
     # Relationships
@@ -67,12 +67,20 @@ class User(Base):
 
 class Board(Base):
     __tablename__ = "boards"
+    # Fetch the database-set updated_at in the UPDATE itself (RETURNING)
+    # instead of expiring it and lazy-loading it on the next read
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False)
     description = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
+    updated_at = Column(
+        DateTime, default=func.now(), server_default=func.now(), onupdate=func.now()
+    )
+    # Bumped by every change to what GET /api/boards returns for the board
+    # (its lists, cards, members and their users); feeds the boards ETag
+    version = Column(Integer, default=0, server_default="0", nullable=False)
 
     # Foreign key to user (owner)
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -90,14 +98,18 @@ class Board(Base):
     )
 
 
+# Case-insensitive board lookups by title
+Index("ix_boards_lower_title", func.lower(Board.title))
+
+
 class BoardMember(Base):
     __tablename__ = "board_members"
 
     id = Column(Integer, primary_key=True, index=True)
     board_id = Column(Integer, ForeignKey("boards.id"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    role = Column(Enum(BoardRole), default=BoardRole.MEMBER)
-    joined_at = Column(DateTime, default=datetime.utcnow)
+    role = Column(String(16), default=BoardRole.MEMBER.value, nullable=False)
+    joined_at = Column(DateTime, default=func.now(), server_default=func.now())
 
     # Relationships
     board = relationship("Board", back_populates="members")
@@ -111,9 +123,9 @@ class Invitation(Base):
     board_id = Column(Integer, ForeignKey("boards.id"), nullable=False)
     inviter_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     invitee_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    status = Column(Enum(InvitationStatus), default=InvitationStatus.PENDING)
+    status = Column(String(16), default=InvitationStatus.PENDING.value, nullable=False)
     message = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
     responded_at = Column(DateTime, nullable=True)
 
     # Relationships
@@ -128,11 +140,12 @@ class Invitation(Base):
 
 class TaskList(Base):
     __tablename__ = "task_lists"
+    __table_args__ = (Index("ix_task_lists_board_position", "board_id", "position"),)
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False)
     position = Column(Integer, default=0)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
     board_id = Column(Integer, ForeignKey("boards.id"), nullable=False)
 
     # Relationships
@@ -144,15 +157,22 @@ class TaskList(Base):
 
 class Card(Base):
     __tablename__ = "cards"
+    __table_args__ = (Index("ix_cards_list_position", "list_id", "position"),)
+    # See Board: keeps updated_at loaded after an UPDATE
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False)
     description = Column(Text, nullable=True)
     position = Column(Integer, default=0)
     checklist = Column(JSON, default=list)
-    priority = Column(Enum(Priority), default=Priority.MEDIUM)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    priority = Column(String(16), default=Priority.MEDIUM.value, nullable=False)
+    created_at = Column(
+        DateTime, default=func.now(), server_default=func.now(), index=True
+    )
+    updated_at = Column(
+        DateTime, default=func.now(), server_default=func.now(), onupdate=func.now()
+    )
     created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
     list_id = Column(Integer, ForeignKey("task_lists.id"), nullable=False)
 
@@ -166,10 +186,15 @@ class Card(Base):
 
 class CardContributor(Base):
     __tablename__ = "card_contributors"
+    __table_args__ = (
+        Index("ix_card_contributors_card_user", "card_id", "user_id", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     card_id = Column(Integer, ForeignKey("cards.id"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    # Set in Python: it is the contributors page cursor and needs sub-second
+    # precision, which SQLite's CURRENT_TIMESTAMP lacks
     contributed_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
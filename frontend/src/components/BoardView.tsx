@@ -369,8 +369,8 @@ const ListComponent: React.FC<ListComponentProps> = ({
                           )}
                         </div>
                       ))}
-                      {card.contributors.length > 2 && (
-                        <div className="contributor-more-mini">+{card.contributors.length - 2}</div>
+                      {card.contributors_count > 2 && (
+                        <div className="contributor-more-mini">+{card.contributors_count - 2}</div>
                       )}
                     </div>
                   )}
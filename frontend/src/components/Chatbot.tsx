@@ -193,20 +193,46 @@ const Chatbot: React.FC<ChatbotProps> = ({ user, currentBoard, onBoardsUpdate, o
     try {
       const conversationHistory = getConversationHistory();
       const currentBoardContext = getCurrentBoardContext();
-      const response = await chatbotAPI.sendMessage(inputText, conversationHistory, currentBoardContext);
-      
-      const botMessage: ChatMessage = {
-        id: (Date.now() + 1).toString(),
-        text: response.data.message,
-        isUser: false,
-        timestamp: new Date(),
-        role: 'assistant'
-      };
-
-      setMessages(prev => [...prev, botMessage]);
+      const botMessageId = (Date.now() + 1).toString();
+      let botMessageAdded = false;
+
+      // Show the reply as it streams in, starting a bot message on the first token
+      const response = await chatbotAPI.streamMessage(
+        inputText,
+        conversationHistory,
+        currentBoardContext,
+        (content) => {
+          if (!botMessageAdded) {
+            botMessageAdded = true;
+            setIsLoading(false);
+            setMessages(prev => [...prev, {
+              id: botMessageId,
+              text: content,
+              isUser: false,
+              timestamp: new Date(),
+              role: 'assistant'
+            }]);
+          } else {
+            setMessages(prev => prev.map(msg =>
+              msg.id === botMessageId ? { ...msg, text: msg.text + content } : msg
+            ));
+          }
+        }
+      );
+
+      // A stream that carried no tokens still has to leave a reply behind
+      if (!botMessageAdded) {
+        setMessages(prev => [...prev, {
+          id: botMessageId,
+          text: response.message || "Done! Let me know if there's anything else I can help with.",
+          isUser: false,
+          timestamp: new Date(),
+          role: 'assistant'
+        }]);
+      }
 
       // Handle any actions that require UI updates
-      handleChatbotAction(response.data);
+      handleChatbotAction(response);
 
     } catch (error) {
       console.error('Chatbot API error:', error);
@@ -185,6 +185,75 @@ export const chatbotAPI = {
       current_board_context: currentBoardContext || null,
     }),
 
+  // Streams the reply as Server-Sent Events. EventSource can only issue GET
+  // requests without an Authorization header, so the stream is read from fetch.
+  streamMessage: async (
+    message: string,
+    conversationHistory: Array<{
+      role: string;
+      content: string;
+      timestamp?: string;
+    }>,
+    currentBoardContext: any,
+    onDelta: (content: string) => void
+  ): Promise<{
+    message: string;
+    action?: string;
+    data?: any;
+  }> => {
+    const token = localStorage.getItem("access_token");
+    const response = await fetch(`${API_BASE_URL}/chatbot/stream`, {
+      method: "POST",
+      headers: {
+        "Content-Type": "application/json",
+        ...(token ? { Authorization: `Bearer ${token}` } : {}),
+      },
+      body: JSON.stringify({
+        message,
+        conversation_history: conversationHistory || [],
+        current_board_context: currentBoardContext || null,
+      }),
+    });
+
+    if (response.status === 401) {
+      localStorage.removeItem("access_token");
+      window.location.href = "/";
+    }
+    if (!response.ok || !response.body) {
+      throw new Error(`Chatbot stream failed with status ${response.status}`);
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = "";
+    let result = { message: "" } as {
+      message: string;
+      action?: string;
+      data?: any;
+    };
+
+    while (true) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+
+      // Events are separated by a blank line
+      const events = buffer.split("\n\n");
+      buffer = events.pop() || "";
+      for (const event of events) {
+        if (!event.startsWith("data: ")) continue;
+        const payload = JSON.parse(event.slice("data: ".length));
+        if (payload.type === "delta") {
+          onDelta(payload.content);
+        } else if (payload.type === "done") {
+          result = payload;
+        }
+      }
+    }
+
+    return result;
+  },
+
   voiceToText: (
     audioBlob: Blob
   ): Promise<
@@ -10,6 +10,7 @@ export interface Card {
   updated_at: string;
   creator: User;
   contributors: Contributor[];
+  contributors_count: number;
 }
 
 export interface TaskList {